@@ -9,23 +9,129 @@ import sqlite3
 import json
 import os
 import sys
+import threading
 from datetime import datetime
+from pathlib import Path
 from collections import defaultdict
 import re
 
+# Numba opsional: kernel pencocokan byte dikompilasi jika tersedia
+try:
+    import numpy as np
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# orjson opsional: serialisasi JSON lebih cepat untuk export
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# google-re2 opsional: regex berbasis automata (waktu linear) untuk --regex
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Opsi command line yang diikuti sebuah nilai (bukan kata kunci)
+OPTIONS_WITH_VALUE = ("--max-results",)
+
+# Di bawah jumlah baris ini, overhead JIT lebih mahal daripada loop Python
+NUMBA_MIN_ROWS = 256
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _find_all(buf, offsets, kws, kw_offsets, out_mask):
+        """Cari setiap kata kunci (bytes) di setiap sel pada buffer gabungan"""
+        n_cells = offsets.shape[0] - 1
+        n_kws = kw_offsets.shape[0] - 1
+        for c in prange(n_cells):
+            start = offsets[c]
+            end = offsets[c + 1]
+            for k in range(n_kws):
+                k_start = kw_offsets[k]
+                k_len = kw_offsets[k + 1] - k_start
+                i = start
+                while i <= end - k_len:
+                    j = 0
+                    while j < k_len and buf[i + j] == kws[k_start + j]:
+                        j += 1
+                    if j == k_len:
+                        out_mask[c, k] = True
+                        break
+                    i += 1
+
+
+def _quote_identifier(name):
+    """Kutip nama tabel/kolom SQLite"""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _cell_text(value):
+    """Teks sebuah sel untuk regex; BLOB di-decode (byte tidak valid diganti)"""
+    if isinstance(value, bytes):
+        return value.decode("utf-8", "replace")
+    return str(value)
+
+
+def _dumps(obj):
+    """Serialisasi objek ke bytes JSON (orjson jika tersedia)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=str)
+        except orjson.JSONEncodeError:
+            # Mis. integer > 64-bit; json standar tidak punya batas ini
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
 
 class FlexibleKeywordAnalyzer:
-    def __init__(self, db_path, keywords, output_file=None, max_results=1000):
+    def __init__(
+        self,
+        db_path,
+        keywords,
+        output_file=None,
+        max_results=1000,
+        build_cache=False,
+        regex=False,
+    ):
         self.db_path = db_path
         self.keywords = keywords if isinstance(keywords, list) else [keywords]
         self.output_file = output_file
         self.max_results = max_results
+        self.build_cache = build_cache
         self.conn = None
+
+        # Mode regex: kata kunci diperlakukan sebagai pola regular expression
+        self.regex = regex
+        self._regex = None
+        self._regex_set = None
+        self._patterns = []
+        if regex:
+            self._compile_patterns()
+
+        # Cache teks huruf kecil per baris di file sidecar, dipakai ulang antar run
+        self.cache_path = f"{db_path}.kwcache"
+        self.cache_conn = None
+        self.cached_tables = set()
+
+        # Timestamp satu kali per pencarian, dipakai untuk semua hasil
+        self._run_ts = None
         self.results = {
             "keywords_searched": self.keywords,
             "total_matches": 0,
             "tables_analyzed": [],
             "matches_by_table": {},
+            # Nama kolom disimpan sekali per tabel, bukan di setiap hasil
+            "table_columns": {},
             "detailed_matches": [],
             "analysis_timestamp": datetime.now().isoformat(),
         }
@@ -37,9 +143,15 @@ class FlexibleKeywordAnalyzer:
                 print(f"❌ [ERROR] File tidak ditemukan: {self.db_path}")
                 return False
 
-            self.conn = sqlite3.connect(self.db_path)
+            # Read-only: database milik Cursor tidak pernah ditulis. Tanpa
+            # immutable=1 karena isi WAL-nya harus tetap terbaca
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True)
             print(f"✅ [SUCCESS] Berhasil terhubung ke database: {self.db_path}")
 
+            if self.regex:
+                self.conn.create_function("KW_REGEX", 1, self._sql_regex)
+
             # Info file
             file_size = os.path.getsize(self.db_path)
             print(
@@ -55,11 +167,48 @@ class FlexibleKeywordAnalyzer:
         """Menutup koneksi database"""
         if self.conn:
             self.conn.close()
+        if self.cache_conn:
+            self.cache_conn.close()
+
+    def _compile_patterns(self):
+        """Kompilasi pola regex (RE2 jika tersedia, fallback ke modul re)"""
+        engine = re2 if RE2_AVAILABLE else re
+        combined = "|".join(f"(?:{keyword})" for keyword in self.keywords)
+        self._regex = engine.compile(f"(?i){combined}")
+
+        if RE2_AVAILABLE:
+            # RE2 Set: satu pemindaian untuk mengetahui pola mana saja yang cocok
+            options = re2.Options()
+            options.case_sensitive = False
+            self._regex_set = re2.Set.SearchSet(options)
+            for keyword in self.keywords:
+                self._regex_set.Add(keyword)
+            self._regex_set.Compile()
+        else:
+            self._patterns = [
+                (keyword, re.compile(keyword, re.IGNORECASE))
+                for keyword in self.keywords
+            ]
+
+    def _sql_regex(self, value):
+        """Fungsi SQL KW_REGEX(kolom): cocok jika nilai memenuhi salah satu pola"""
+        return value is not None and self._regex.search(_cell_text(value)) is not None
+
+    def _regex_hits(self, value_str):
+        """Kembalikan set pola (kata kunci) yang cocok dengan sebuah nilai"""
+        if self._regex_set is not None:
+            # Match() mengembalikan None jika tidak ada pola yang cocok
+            matched = self._regex_set.Match(value_str) or ()
+            return {self.keywords[i] for i in matched}
+        return {keyword for keyword, pattern in self._patterns if pattern.search(value_str)}
 
     def get_tables(self):
         """Mendapatkan daftar semua tabel dalam database"""
         cursor = self.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+        # Tabel internal SQLite (sqlite_sequence, sqlite_stat1) tidak ikut dianalisa
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
+        )
         return [table[0] for table in cursor.fetchall()]
 
     def search_keywords(self):
@@ -71,11 +220,20 @@ class FlexibleKeywordAnalyzer:
         tables = self.get_tables()
         print(f"📋 [INFO] Menganalisa {len(tables)} tabel: {', '.join(tables)}")
 
+        self._run_ts = datetime.now().isoformat()
+
+        if self.build_cache:
+            self.create_cache(tables)
+        self.open_cache()
+
         total_matches = 0
 
         for table_name in tables:
             print(f"\n🔍 [TABLE] Menganalisa tabel: {table_name}")
-            table_matches = self._search_in_table(table_name)
+            if table_name in self.cached_tables:
+                table_matches = self._search_in_cache(table_name)
+            else:
+                table_matches = self._search_in_table(table_name)
 
             if table_matches:
                 self.results["matches_by_table"][table_name] = len(table_matches)
@@ -108,57 +266,308 @@ class FlexibleKeywordAnalyzer:
         matches = []
 
         try:
-            # Dapatkan info kolom
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [col[1] for col in cursor.fetchall()]
+            columns, searchable_columns = self._get_columns(table_name)
+            if not searchable_columns:
+                return matches
 
-            # Buat kondisi pencarian untuk setiap kata kunci
+            # Buat kondisi pencarian untuk setiap kata kunci; nama tabel/kolom dikutip
+            # dan pola LIKE diikat sebagai parameter, bukan disisipkan ke SQL
+            quoted_columns = [_quote_identifier(col) for col in searchable_columns]
             search_conditions = []
-            for keyword in self.keywords:
-                for col in columns:
-                    # Gunakan LIKE untuk pencarian case-insensitive
-                    search_conditions.append(f"LOWER({col}) LIKE '%{keyword.lower()}%'")
+            params = []
+            if self.regex:
+                # Semua pola digabung; dievaluasi lewat fungsi SQL KW_REGEX. Nilai
+                # dikirim sebagai BLOB: teks UTF-8 tidak valid gagal di-decode sqlite3
+                for col in quoted_columns:
+                    search_conditions.append(f"KW_REGEX(CAST({col} AS BLOB))")
+            else:
+                for keyword in self.keywords:
+                    pattern = f"%{keyword.lower()}%"
+                    for col in quoted_columns:
+                        # Gunakan LIKE untuk pencarian case-insensitive
+                        search_conditions.append(f"LOWER({col}) LIKE ?")
+                        params.append(pattern)
 
             if search_conditions:
+                # Batas maksimal per tabel lewat LIMIT: SQLite berhenti memindai
+                # begitu batas tercapai
                 query = (
-                    f"SELECT * FROM {table_name} WHERE {' OR '.join(search_conditions)}"
+                    f"SELECT * FROM {_quote_identifier(table_name)} "
+                    f"WHERE {' OR '.join(search_conditions)} LIMIT ?"
                 )
-                cursor.execute(query)
+                cursor.execute(query, params + [self.max_results])
                 rows = cursor.fetchall()
-
-                # Proses hasil
-                for row in rows:
-                    match_data = {
-                        "table": table_name,
-                        "columns": columns,
-                        "data": {},
-                        "matched_keywords": [],
-                        "match_timestamp": datetime.now().isoformat(),
-                    }
-
-                    # Simpan data dan identifikasi kata kunci yang cocok
-                    for col, value in zip(columns, row):
-                        match_data["data"][col] = value
-
-                        # Cek kata kunci yang cocok
-                        if value:
-                            value_str = str(value).lower()
-                            for keyword in self.keywords:
-                                if keyword.lower() in value_str:
-                                    if keyword not in match_data["matched_keywords"]:
-                                        match_data["matched_keywords"].append(keyword)
-
-                    matches.append(match_data)
-
-                    # Cek batas maksimal per tabel
-                    if len(matches) >= self.max_results:
-                        break
+                matches = self._build_matches(table_name, columns, rows)
 
         except Exception as e:
             print(f"   ⚠️ Error dalam tabel {table_name}: {e}")
 
         return matches
 
+    def _get_columns(self, table_name):
+        """Kembalikan (semua kolom, kolom yang dapat dicari) dari sebuah tabel"""
+        cursor = self.conn.cursor()
+        # Dapatkan info kolom beserta tipe yang dideklarasikan
+        cursor.execute(f"PRAGMA table_info({_quote_identifier(table_name)})")
+        table_info = cursor.fetchall()
+        # Satu tuple nama kolom (di-intern) dipakai bersama oleh semua hasil
+        columns = tuple(sys.intern(col[1]) for col in table_info)
+
+        # Hanya kolom teks/BLOB yang dicari; kolom numerik tidak perlu di-cast
+        searchable_columns = [
+            col[1] for col in table_info if self._is_searchable_type(col[2])
+        ]
+        return columns, searchable_columns
+
+    def _build_matches(self, table_name, columns, rows):
+        """Susun data hasil untuk baris-baris yang cocok"""
+        matches = []
+        if rows:
+            self.results["table_columns"][table_name] = list(columns)
+
+        # Identifikasi kata kunci dan kolom yang cocok untuk semua baris sekaligus
+        matched_per_row = self._match_rows(rows, columns)
+
+        # Proses hasil
+        for row, (matched_keywords, matched_cols) in zip(rows, matched_per_row):
+            match_data = {
+                "table": table_name,
+                "data": dict(zip(columns, row)),
+                "matched_keywords": matched_keywords,
+                "matched_cols": matched_cols,
+                "match_timestamp": self._run_ts,
+            }
+            matches.append(match_data)
+
+        return matches
+
+    def _db_signature(self):
+        """Tanda versi file database (termasuk file -wal) untuk validasi cache"""
+        stat = os.stat(self.db_path)
+        # state.vscdb memakai WAL: perubahan yang belum di-checkpoint hanya ada di -wal
+        # (-wal kosong atau tidak ada berarti semua isi sudah ada di file utama)
+        try:
+            wal_stat = os.stat(f"{self.db_path}-wal")
+        except FileNotFoundError:
+            wal_stat = None
+        if wal_stat is not None and wal_stat.st_size:
+            wal_signature = (wal_stat.st_mtime_ns, wal_stat.st_size)
+        else:
+            wal_signature = (0, 0)
+        return (stat.st_mtime_ns, stat.st_size) + wal_signature
+
+    def create_cache(self, tables):
+        """Bangun tabel _kwcache (teks huruf kecil per baris) di file sidecar"""
+        print(f"\n🗄️  [CACHE] Membangun cache pencarian: {self.cache_path}")
+
+        if os.path.exists(self.cache_path):
+            os.remove(self.cache_path)
+
+        # uri=True agar ATTACH menerima URI; path cache sendiri tetap nama file biasa
+        cache_conn = sqlite3.connect(self.cache_path, uri=True)
+        built = False
+        # Tanda versi diambil sebelum membaca: perubahan selama build membuat cache basi
+        signature = self._db_signature()
+        try:
+            # Sumber dilampirkan read-only: membangun cache tidak pernah menulis ke database
+            cache_conn.execute(
+                "ATTACH DATABASE ? AS src",
+                (f"{Path(self.db_path).resolve().as_uri()}?mode=ro",),
+            )
+            cache_conn.execute(
+                "CREATE TABLE _kwcache (source_table TEXT, source_rowid INTEGER, hay TEXT)"
+            )
+            cache_conn.execute("CREATE TABLE _kwcache_tables (name TEXT PRIMARY KEY)")
+            cache_conn.execute(
+                "CREATE TABLE _kwcache_meta (db_mtime_ns INTEGER, db_size INTEGER, "
+                "wal_mtime_ns INTEGER, wal_size INTEGER)"
+            )
+
+            for table_name in tables:
+                _, searchable_columns = self._get_columns(table_name)
+                if not searchable_columns:
+                    continue
+
+                # Gabungkan semua kolom teks dengan pemisah baris baru
+                hay = " || char(10) || ".join(
+                    f"coalesce({_quote_identifier(col)}, '')"
+                    for col in searchable_columns
+                )
+                try:
+                    cache_conn.execute(
+                        f"INSERT INTO _kwcache SELECT ?, rowid, lower({hay}) "
+                        f"FROM src.{_quote_identifier(table_name)}",
+                        (table_name,),
+                    )
+                except sqlite3.OperationalError as e:
+                    # Misalnya tabel WITHOUT ROWID: tetap dicari langsung
+                    print(f"   ⚠️ Tabel {table_name} tidak di-cache: {e}")
+                    continue
+                cache_conn.execute(
+                    "INSERT INTO _kwcache_tables VALUES (?)", (table_name,)
+                )
+
+            cache_conn.execute("CREATE INDEX _kwcache_source ON _kwcache(source_table)")
+            cache_conn.execute(
+                "INSERT INTO _kwcache_meta VALUES (?, ?, ?, ?)", signature
+            )
+            cache_conn.commit()
+            built = True
+            print("   ✅ Cache selesai dibangun")
+        except Exception as e:
+            print(f"   ⚠️ Gagal membangun cache: {e}")
+        finally:
+            cache_conn.close()
+            # Jangan tinggalkan cache setengah jadi
+            if not built and os.path.exists(self.cache_path):
+                os.remove(self.cache_path)
+
+    def open_cache(self):
+        """Buka cache sidecar jika ada dan masih sesuai dengan file database"""
+        if not os.path.exists(self.cache_path):
+            return False
+
+        cache_conn = sqlite3.connect(self.cache_path)
+        try:
+            signature = cache_conn.execute(
+                "SELECT db_mtime_ns, db_size, wal_mtime_ns, wal_size FROM _kwcache_meta"
+            ).fetchone()
+            if signature != self._db_signature():
+                print("⚠️  [CACHE] Cache kedaluwarsa, gunakan --build-cache untuk membangun ulang")
+                cache_conn.close()
+                return False
+
+            if self.regex:
+                cache_conn.create_function("KW_REGEX", 1, self._sql_regex)
+
+            self.cached_tables = {
+                row[0] for row in cache_conn.execute("SELECT name FROM _kwcache_tables")
+            }
+        except sqlite3.DatabaseError as e:
+            print(f"⚠️  [CACHE] Cache tidak dapat dibaca: {e}")
+            cache_conn.close()
+            return False
+
+        self.cache_conn = cache_conn
+        print(f"🗄️  [CACHE] Menggunakan cache pencarian: {self.cache_path}")
+        return True
+
+    def _search_in_cache(self, table_name):
+        """Mencari kata kunci lewat _kwcache lalu ambil baris aslinya berdasarkan rowid"""
+        matches = []
+
+        try:
+            if self.regex:
+                # hay bisa berisi byte BLOB yang bukan UTF-8 valid
+                conditions = "KW_REGEX(CAST(hay AS BLOB))"
+                params = [table_name]
+            else:
+                conditions = " OR ".join("hay LIKE ?" for _ in self.keywords)
+                params = [table_name] + [
+                    f"%{keyword.lower()}%" for keyword in self.keywords
+                ]
+            rowids = [
+                row[0]
+                for row in self.cache_conn.execute(
+                    f"SELECT source_rowid FROM _kwcache "
+                    f"WHERE source_table = ? AND ({conditions}) LIMIT ?",
+                    params + [self.max_results],
+                )
+            ]
+
+            columns, _ = self._get_columns(table_name)
+            cursor = self.conn.cursor()
+            rows = []
+            # Ambil per potongan agar tidak melewati batas jumlah parameter SQLite
+            for i in range(0, len(rowids), 500):
+                chunk = rowids[i : i + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                cursor.execute(
+                    f"SELECT * FROM {_quote_identifier(table_name)} "
+                    f"WHERE rowid IN ({placeholders})",
+                    chunk,
+                )
+                rows.extend(cursor.fetchall())
+
+            matches = self._build_matches(table_name, columns, rows)
+
+        except Exception as e:
+            print(f"   ⚠️ Error dalam cache tabel {table_name}: {e}")
+
+        return matches
+
+    @staticmethod
+    def _is_searchable_type(declared_type):
+        """Cek apakah kolom SQLite bisa berisi teks (semua afinitas selain INTEGER)"""
+        # REAL/NUMERIC (mis. JSON, DATETIME, BOOLEAN) tetap menyimpan teks yang bukan
+        # angka apa adanya, jadi hanya afinitas INTEGER yang dilewati
+        return "INT" not in (declared_type or "").upper()
+
+    def _match_rows(self, rows, columns):
+        """Kembalikan (kata kunci cocok, kolom cocok) untuk setiap baris"""
+        if not self.regex and NUMBA_AVAILABLE and len(rows) >= NUMBA_MIN_ROWS:
+            return self._match_rows_numba(rows, columns)
+
+        matched_per_row = []
+        for row in rows:
+            # Set agar deduplikasi O(1) per kata kunci
+            matched_keywords = set()
+            matched_cols = []
+            for col, value in zip(columns, row):
+                # Cek kata kunci yang cocok
+                if value:
+                    if self.regex:
+                        hits = self._regex_hits(_cell_text(value))
+                    else:
+                        value_str = str(value).lower()
+                        hits = {
+                            keyword
+                            for keyword in self.keywords
+                            if keyword.lower() in value_str
+                        }
+                    if hits:
+                        matched_keywords.update(hits)
+                        matched_cols.append(col)
+            matched_per_row.append((sorted(matched_keywords), matched_cols))
+        return matched_per_row
+
+    def _match_rows_numba(self, rows, columns):
+        """Versi kompilasi Numba: semua sel di-encode ke satu buffer uint8"""
+        cell_blobs = [
+            str(value).lower().encode("utf-8", "ignore") if value else b""
+            for row in rows
+            for value in row
+        ]
+        offsets = np.zeros(len(cell_blobs) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(blob) for blob in cell_blobs])
+        buf = np.frombuffer(b"".join(cell_blobs), dtype=np.uint8)
+
+        kw_blobs = [keyword.lower().encode("utf-8", "ignore") for keyword in self.keywords]
+        kw_offsets = np.zeros(len(kw_blobs) + 1, dtype=np.int64)
+        kw_offsets[1:] = np.cumsum([len(blob) for blob in kw_blobs])
+        kws = np.frombuffer(b"".join(kw_blobs), dtype=np.uint8)
+
+        out_mask = np.zeros((len(cell_blobs), len(kw_blobs)), dtype=np.bool_)
+        _find_all(buf, offsets, kws, kw_offsets, out_mask)
+
+        # Satu baris mask per sel; kelompokkan kembali per baris tabel
+        n_cols = len(columns)
+        matched_per_row = []
+        for r in range(len(rows)):
+            row_mask = out_mask[r * n_cols : (r + 1) * n_cols]
+            matched_keywords = sorted(
+                {
+                    keyword
+                    for keyword, hit in zip(self.keywords, row_mask.any(axis=0))
+                    if hit
+                }
+            )
+            matched_cols = [
+                col for col, hit in zip(columns, row_mask.any(axis=1)) if hit
+            ]
+            matched_per_row.append((matched_keywords, matched_cols))
+        return matched_per_row
+
     def display_results(self):
         """Menampilkan hasil pencarian di konsol"""
         print("\n" + "=" * 80)
@@ -192,14 +601,11 @@ class FlexibleKeywordAnalyzer:
                 f"      🏷️  Kata kunci yang cocok: {', '.join(match['matched_keywords'])}"
             )
 
-            for col, value in match["data"].items():
-                if value and any(
-                    keyword.lower() in str(value).lower()
-                    for keyword in match["matched_keywords"]
-                ):
-                    formatted_value = self._format_value(value)
-                    print(f"      🔑 {col}:")
-                    print(f"         {formatted_value}")
+            # Kolom yang cocok sudah dicatat saat pencarian
+            for col in match["matched_cols"]:
+                formatted_value = self._format_value(match["data"][col])
+                print(f"      🔑 {col}:")
+                print(f"         {formatted_value}")
 
             table_display_count[table] += 1
 
@@ -243,8 +649,19 @@ class FlexibleKeywordAnalyzer:
             self.output_file = f"keyword_search_{timestamp}.json"
 
         try:
-            with open(self.output_file, "w", encoding="utf-8") as f:
-                json.dump(self.results, f, indent=2, ensure_ascii=False, default=str)
+            # Tulis bertahap: metadata dulu, lalu setiap hasil satu per satu
+            with open(self.output_file, "wb", buffering=1 << 20) as f:
+                f.write(b"{\n")
+                for key, value in self.results.items():
+                    if key != "detailed_matches":
+                        f.write(b"  " + _dumps(key) + b": " + _dumps(value) + b",\n")
+
+                f.write(b'  "detailed_matches": [\n')
+                for i, match in enumerate(self.results["detailed_matches"]):
+                    if i:
+                        f.write(b",\n")
+                    f.write(b"    " + _dumps(match))
+                f.write(b"\n  ]\n}\n")
 
             print(f"\n💾 [EXPORT] Hasil berhasil disimpan ke: {self.output_file}")
             print(f"📊 Total hasil yang diexport: {self.results['total_matches']}")
@@ -254,17 +671,104 @@ class FlexibleKeywordAnalyzer:
             return None
 
 
-def get_keywords_from_input():
+def prewarm_database(db_path):
+    """Panaskan page cache di thread latar belakang selama pengguna mengetik kata kunci
+
+    Mengembalikan fungsi stop() yang dipanggil begitu input selesai, agar pemanasan
+    tidak bersaing I/O dengan pencarian yang sebenarnya.
+    """
+    try:
+        # Koneksi read-only terpisah; dibuka di sini agar stop() bisa meng-interrupt-nya
+        conn = sqlite3.connect(
+            f"{Path(db_path).resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+        )
+    except sqlite3.Error:
+        return lambda: None
+
+    stopped = threading.Event()
+    # interrupt() tidak boleh berjalan bersamaan dengan close()
+    lock = threading.Lock()
+
+    def _warm():
+        try:
+            tables = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table'"
+                )
+            ]
+            for table_name in tables:
+                if stopped.is_set():
+                    break
+                quoted_table = _quote_identifier(table_name)
+                columns = [
+                    row[1]
+                    for row in conn.execute(f"PRAGMA table_info({quoted_table})")
+                ]
+                if not columns:
+                    continue
+                # count(*) cukup membaca autoindex; NOT INDEXED + CAST memaksa
+                # b-tree tabel beserta halaman overflow-nya ikut terbaca
+                total_bytes = " + ".join(
+                    f"ifnull(length(CAST({_quote_identifier(col)} AS BLOB)), 0)"
+                    for col in columns
+                )
+                conn.execute(
+                    f"SELECT sum({total_bytes}) FROM {quoted_table} NOT INDEXED"
+                ).fetchone()
+        except sqlite3.Error:
+            # Pemanasan hanya optimasi; kegagalan (termasuk interrupt) diabaikan
+            pass
+        finally:
+            with lock:
+                conn.close()
+
+    thread = threading.Thread(target=_warm, daemon=True)
+    thread.start()
+
+    def stop():
+        with lock:
+            stopped.set()
+            try:
+                # Batalkan query yang sedang berjalan, tidak menunggu tabel selesai
+                conn.interrupt()
+            except sqlite3.ProgrammingError:
+                # Koneksi sudah ditutup: pemanasan sudah selesai
+                pass
+        thread.join()
+
+    return stop
+
+
+def get_keywords_from_input(db_path=None):
     """Mendapatkan kata kunci dari input pengguna"""
-    if len(sys.argv) > 2:
-        # Kata kunci dari command line arguments
-        return sys.argv[2:]
+    # Kata kunci dari command line arguments (lewati opsi dan nilainya)
+    cli_keywords = []
+    args = iter(sys.argv[2:])
+    for arg in args:
+        if arg.startswith("--"):
+            if arg in OPTIONS_WITH_VALUE:
+                next(args, None)
+            continue
+        cli_keywords.append(arg)
+
+    if cli_keywords:
+        return cli_keywords
     else:
+        # Baca halaman database ke cache sambil menunggu input kata kunci
+        stop_prewarm = prewarm_database(db_path) if db_path else None
+
         # Input interaktif
-        print(
-            "🔍 [INPUT] Masukkan kata kunci yang ingin dicari (pisahkan dengan koma):"
-        )
-        keywords_input = input("Kata kunci: ").strip()
+        try:
+            print(
+                "🔍 [INPUT] Masukkan kata kunci yang ingin dicari (pisahkan dengan koma):"
+            )
+            keywords_input = input("Kata kunci: ").strip()
+        finally:
+            if stop_prewarm:
+                stop_prewarm()
 
         if not keywords_input:
             print("❌ [ERROR] Kata kunci tidak boleh kosong!")
@@ -325,7 +829,7 @@ def main():
     print(f"🗃️  [DATABASE] Menggunakan file: {db_path}")
 
     # Dapatkan kata kunci
-    keywords = get_keywords_from_input()
+    keywords = get_keywords_from_input(db_path)
     if not keywords:
         return
 
@@ -340,8 +844,24 @@ def main():
         except:
             print("⚠️  [WARNING] Invalid --max-results value, using default 1000")
 
+    # Bangun (ulang) cache pencarian untuk run berikutnya
+    build_cache = "--build-cache" in sys.argv
+
+    # Kata kunci sebagai pola regex
+    regex = "--regex" in sys.argv
+
     # Inisialisasi analyzer
-    analyzer = FlexibleKeywordAnalyzer(db_path, keywords, max_results=max_results)
+    try:
+        analyzer = FlexibleKeywordAnalyzer(
+            db_path,
+            keywords,
+            max_results=max_results,
+            build_cache=build_cache,
+            regex=regex,
+        )
+    except Exception as e:
+        print(f"❌ [ERROR] Pola regex tidak valid: {e}")
+        return
 
     try:
         # Koneksi ke database
@@ -367,6 +887,10 @@ def main():
             "\n💡 [TIPS] Gunakan --max-results <number> untuk membatasi hasil pencarian"
         )
         print("💡 [TIPS] Contoh: python flexible_keyword_analyzer.py --max-results 500")
+        print(
+            "💡 [TIPS] Gunakan --build-cache agar pencarian berikutnya memakai cache"
+        )
+        print("💡 [TIPS] Gunakan --regex agar kata kunci dibaca sebagai pola regex")
 
     except Exception as e:
         print(f"❌ [ERROR] Terjadi kesalahan: {e}")
@@ -11,8 +11,86 @@ import os
 import sys
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from math import isfinite
+from pathlib import Path
 import re
 
+# pyahocorasick opsional: klasifikasi key kredensial dalam satu pemindaian
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson opsional: parser JSON C yang jauh lebih cepat dari json standar
+try:
+    import orjson
+    
+    # orjson membaca integer >= 19 digit (di luar int64/uint64) sebagai float tanpa
+    # error; teks dengan deret digit sepanjang ini di-parse json standar.
+    # translate() memetakan digit ke '0' dan karakter lain ke spasi
+    _DIGIT_MASK = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+    _LONG_DIGIT_RUN = b'0' * 19
+    
+    class _NonFiniteFloat(float):
+        """NaN/Infinity: orjson menulisnya sebagai null, json standar sebagai NaN/Infinity"""
+        __slots__ = ()
+    
+    def _parse_float(text):
+        """parse_float json standar: float tak hingga (mis. 1e999) ditandai _NonFiniteFloat"""
+        value = float(text)
+        return value if isfinite(value) else _NonFiniteFloat(value)
+    
+    def _json_loads(text):
+        encoded = text.encode('utf-8', 'surrogatepass')
+        if _LONG_DIGIT_RUN not in encoded.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(encoded)
+            except orjson.JSONDecodeError:
+                # orjson menolak NaN/Infinity dan angka di luar jangkauan double
+                pass
+        return json.loads(text, parse_float=_parse_float, parse_constant=_NonFiniteFloat)
+    
+    def _orjson_default(obj):
+        # NaN/Infinity dilempar balik agar _dumps memakai json standar
+        if isinstance(obj, _NonFiniteFloat):
+            raise TypeError('non-finite float')
+        return str(obj)
+    
+    def _dumps(obj):
+        try:
+            return orjson.dumps(obj, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # Integer > 64-bit atau NaN/Infinity dari sel yang di-parse json standar
+            return _EXPORT_ENCODER.encode(obj).encode('utf-8')
+except ImportError:
+    _json_loads = json.loads
+    
+    def _dumps(obj):
+        return _EXPORT_ENCODER.encode(obj).encode('utf-8')
+
+# Encoder json standar untuk export, dipakai ulang untuk setiap entri
+_EXPORT_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+def _stream_json(f, items, indent=b'      '):
+    """Tulis item satu per satu sebagai isi array JSON (tanpa kurung), dipisah koma"""
+    for i, item in enumerate(items):
+        if i:
+            f.write(b',\n')
+        f.write(indent + _dumps(item))
+
+# Tipe entri untuk setiap kelompok informasi kredensial
+CREDENTIAL_TYPES = {
+    'tokens': 'token',
+    'api_keys': 'api_key',
+    'user_ids': 'user_id',
+    'subscription_info': 'subscription',
+    'account_status': 'status'
+}
+
 class KeywordAnalyzer:
     def __init__(self, db_path, quick_mode=False, max_items=1000):
         self.db_path = db_path
@@ -25,6 +103,9 @@ class KeywordAnalyzer:
             'raw_data': []
         }
         
+        # Cache nama kolom per tabel (PRAGMA table_info cukup sekali per tabel)
+        self._table_columns = {}
+        
         # Daftar kata kunci penting untuk dianalisa
         self.target_keywords = {
             'authentication': {
@@ -79,6 +160,56 @@ class KeywordAnalyzer:
             'medium_sensitive': ['userid', 'email', 'api', 'auth'],
             'low_sensitive': ['plan', 'status', 'mode', 'feature']
         }
+        
+        # Kata kunci kredensial per kelompok, urut sesuai prioritas pengecekan
+        self.credential_keywords = [
+            ('tokens', ['token', 'access', 'refresh', 'bearer']),
+            ('api_keys', ['api', 'key', 'secret']),
+            ('user_ids', ['userid', 'user_id', 'uid']),
+            ('subscription_info', ['plan', 'subscription', 'trial', 'premium', 'pro']),
+            ('account_status', ['status', 'active', 'enabled'])
+        ]
+        self._classify_json_key = self._build_key_classifier(self.credential_keywords)
+        self._classify_column = self._build_key_classifier([
+            ('tokens', ['token', 'access', 'refresh']),
+            ('user_ids', ['userid', 'user_id'])
+        ])
+        
+        # Satu regex untuk tingkat sensitivitas. Tingkat 'high' menang jika muncul di mana
+        # saja dalam teks, jadi setiap tingkat dicek lewat lookahead dari awal teks
+        self._sens_re = re.compile('(?s)' + '|'.join(
+            f"(?=.*?(?P<{level}>" + '|'.join(map(re.escape, self.sensitive_categories[f'{level}_sensitive'])) + '))'
+            for level in ('high', 'medium')
+        ))
+        
+        # Encoder untuk tampilan JSON dibuat sekali, bukan di setiap json.dumps()
+        self._json_encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+        
+        # Kompilasi pattern regex sekali saja (urutan sama dengan 'patterns')
+        self._compiled_patterns = {
+            category: [re.compile(pattern, re.IGNORECASE) for pattern in config['patterns']]
+            for category, config in self.target_keywords.items()
+        }
+        
+        # Pola LIKE gabungan semua kategori untuk prefilter SQL. Kata kunci yang memuat
+        # kata kunci lain (mis. 'blackboxai' memuat 'blackbox') sudah tercakup oleh
+        # LIKE kata kunci yang lebih pendek
+        all_keywords = list(dict.fromkeys(
+            keyword.lower()
+            for config in self.target_keywords.values()
+            for keyword in config['keywords']
+        ))
+        self._like_patterns = [
+            f"%{keyword}%" for keyword in all_keywords
+            if not any(other != keyword and other in keyword for other in all_keywords)
+        ]
+        
+        # Kata kunci per kategori sebagai bytes lowercase: pengecekan substring pada
+        # bytes berjalan di buffer uint8, lebih cepat dari str atau regex per baris
+        self._kw_bytes = {
+            category: [(keyword, keyword.lower().encode('utf-8')) for keyword in config['keywords']]
+            for category, config in self.target_keywords.items()
+        }
 
     def connect(self):
         """Koneksi ke database SQLite"""
@@ -87,7 +218,7 @@ class KeywordAnalyzer:
                 print(f"❌ [ERROR] File tidak ditemukan: {self.db_path}")
                 return False
             
-            self.conn = sqlite3.connect(self.db_path)
+            self.conn = self._open_readonly_connection()
             print(f"✅ [SUCCESS] Berhasil terhubung ke database: {self.db_path}")
             
             # Info file
@@ -99,6 +230,47 @@ class KeywordAnalyzer:
             print(f"❌ [ERROR] Gagal terhubung: {e}")
             return False
 
+    @staticmethod
+    def _configure_connection(conn):
+        """Terapkan pengaturan yang sama ke setiap koneksi (utama maupun worker)"""
+        # Akses kolom berdasarkan nama langsung dari baris hasil query
+        conn.row_factory = sqlite3.Row
+        
+        # Kolom sudah di-LOWER() sebelum LIKE, jadi LIKE case-sensitive memberi hasil
+        # yang sama tanpa case folding per karakter
+        try:
+            conn.execute("PRAGMA case_sensitive_like=ON")
+        except sqlite3.Error:
+            pass
+        
+        # Beban kerja murni baca: tolak penulisan, temp di memori, halaman via mmap
+        # dan cache halaman 64 MB
+        try:
+            conn.executescript(
+                "PRAGMA query_only=ON;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA mmap_size=268435456;"
+                "PRAGMA cache_size=-65536;"
+            )
+        except sqlite3.Error:
+            pass
+
+    def _open_readonly_connection(self):
+        """Buka koneksi read-only ke database"""
+        # Tanpa immutable=1: file bisa sedang dipakai Cursor dan WAL-nya harus tetap terbaca
+        uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+        conn = sqlite3.connect(uri, uri=True)
+        self._configure_connection(conn)
+        return conn
+
+    def _search_table_worker(self, table_name):
+        """Cari satu tabel dengan koneksi sendiri (objek sqlite3 tidak dibagi antar thread)"""
+        conn = self._open_readonly_connection()
+        try:
+            return self._search_in_table(table_name, conn)
+        finally:
+            conn.close()
+
     def close(self):
         """Tutup koneksi database"""
         if self.conn:
@@ -127,7 +299,7 @@ class KeywordAnalyzer:
         total_matches = 0
         processed_items = 0
         
-        for table_name in tables:
+        for table_name, get_matches in self._iter_table_searches(tables):
             print(f"\n🔍 [TABLE] Menganalisa tabel: {table_name}")
             
             # Cek apakah sudah mencapai limit dalam quick mode
@@ -135,7 +307,7 @@ class KeywordAnalyzer:
                 print(f"   ⚡ [QUICK MODE] Mencapai limit {self.max_items} item - skip tabel ini")
                 break
                 
-            table_matches = self._search_in_table(table_name)
+            table_matches = get_matches()
             
             table_total = sum(len(matches) for matches in table_matches.values())
             total_matches += table_total
@@ -144,19 +316,27 @@ class KeywordAnalyzer:
             if table_total > 0:
                 print(f"   ✅ Ditemukan {table_total} hasil")
                 # Gabungkan hasil ke kategori yang sesuai
+                # Satu baris bisa cocok dengan beberapa kategori tetapi disimpan sekali
+                table_rows = {}
                 for category, matches in table_matches.items():
                     if self.quick_mode:
                         # Limit hasil per kategori dalam quick mode
                         remaining_slots = max(0, self.max_items - len(self.results['keywords'][category]))
+                        for dropped in matches[remaining_slots:]:
+                            dropped['categories'].remove(category)
+                            del dropped['keywords_by_category'][category]
                         matches = matches[:remaining_slots]
                     
                     self.results['keywords'][category].extend(matches)
-                    # Tambahkan ke raw data juga
-                    self.results['raw_data'].extend(matches)
+                    for match in matches:
+                        table_rows[id(match)] = match
                     
                     # Progress indicator
                     if processed_items % 1000 == 0:
                         print(f"   📊 Progress: {processed_items} items processed...")
+                
+                # Raw data berisi setiap baris unik sekali
+                self.results['raw_data'].extend(table_rows.values())
             else:
                 print(f"   ❌ Tidak ada hasil")
         
@@ -171,85 +351,135 @@ class KeywordAnalyzer:
             if matches:
                 print(f"   📁 {category.title().replace('_', ' ')}: {len(matches)} item")
 
-    def _search_in_table(self, table_name):
+    def _iter_table_searches(self, tables):
+        """Hasilkan (tabel, fungsi pengambil hasil) sesuai urutan tabel"""
+        if self.quick_mode or len(tables) <= 1:
+            # Quick mode dipindai berurutan agar tabel sisa benar-benar dilewati
+            # begitu limit tercapai
+            for table_name in tables:
+                yield table_name, partial(self._search_in_table, table_name)
+            return
+        
+        # Setiap tabel dipindai paralel dengan koneksi read-only per thread; hasil
+        # diambil sesuai urutan tabel sehingga output tetap deterministik dan
+        # progres tercetak begitu tabel tersebut selesai
+        max_workers = max(1, min(len(tables), os.cpu_count() or 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._search_table_worker, table_name) for table_name in tables]
+            for table_name, future in zip(tables, futures):
+                yield table_name, future.result
+
+    def _search_in_table(self, table_name, conn=None):
         """Cari kata kunci dalam tabel tertentu"""
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         category_matches = {category: [] for category in self.target_keywords}
+        quoted_table = self._quote_identifier(table_name)
         
         try:
             # Dapatkan info kolom
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [col[1] for col in cursor.fetchall()]
+            columns = self._table_columns.get(table_name)
+            if columns is None:
+                cursor.execute(f"PRAGMA table_info({quoted_table})")
+                columns = self._table_columns[table_name] = [col[1] for col in cursor.fetchall()]
             
-            # Cari untuk setiap kategori
-            for category, config in self.target_keywords.items():
-                # Buat query pencarian
-                search_conditions = []
-                
-                # Tambahkan kondisi untuk keywords
-                for keyword in config['keywords']:
-                    for col in columns:
-                        search_conditions.append(f"LOWER({col}) LIKE '%{keyword.lower()}%'")
+            # Satu query per tabel untuk gabungan kata kunci semua kategori;
+            # nilai LIKE diikat sebagai parameter, bukan disisipkan ke SQL
+            search_conditions = []
+            params = []
+            for pattern in self._like_patterns:
+                for col in columns:
+                    search_conditions.append(f"LOWER({self._quote_identifier(col)}) LIKE ?")
+                    params.append(pattern)
+            
+            if search_conditions:
+                query = f"SELECT * FROM {quoted_table} WHERE {' OR '.join(search_conditions)}"
+                cursor.execute(query, params)
+                category_limit = self.max_items // len(self.target_keywords)
                 
-                if search_conditions:
-                    query = f"SELECT * FROM {table_name} WHERE {' OR '.join(search_conditions)}"
-                    if self.quick_mode:
-                        query += f" LIMIT {self.max_items // len(self.target_keywords)}"
-                    cursor.execute(query)
-                    rows = cursor.fetchall()
+                # Proses hasil langsung dari cursor (tanpa fetchall) agar memori tetap
+                # sebanding satu baris; setiap baris dibagi ke kategori yang cocok
+                for row in cursor:
+                    # Sel dipisah newline agar tidak ada kecocokan lintas kolom; lower() pada
+                    # bytes hanya melipat ASCII, sama seperti LOWER() di SQLite
+                    row_bytes = b'\n'.join(
+                        str(value).encode('utf-8', 'ignore').lower() for value in row if value
+                    )
+                    match_data = None
                     
-                    # Proses hasil
-                    for row in rows:
-                        match_data = {
-                            'table': table_name,
-                            'category': category,
-                            'columns': columns,
-                            'data': {},
-                            'matched_keywords': [],
-                            'sensitivity': 'low'
-                        }
+                    for category, keyword_bytes in self._kw_bytes.items():
+                        if self.quick_mode and len(category_matches[category]) >= category_limit:
+                            continue
                         
-                        # Simpan data dan identifikasi kata kunci yang cocok
-                        for col, value in zip(columns, row):
-                            match_data['data'][col] = value
+                        category_keywords = [
+                            keyword for keyword, encoded in keyword_bytes if encoded in row_bytes
+                        ]
+                        if not category_keywords:
+                            continue
+                        
+                        # Satu dict per baris, dibagi oleh semua kategori yang cocok
+                        if match_data is None:
+                            match_data = {
+                                'table': table_name,
+                                'categories': [],
+                                'columns': columns,
+                                'data': dict(row),
+                                'matched_keywords': [],
+                                'keywords_by_category': {},
+                                'sensitivity': 'low'
+                            }
+                            
+                            # Parse sel JSON sekali, dipakai ulang oleh ekstraksi dan export
+                            match_data['parsed'] = self._parse_json_cells(match_data['data'])
                             
-                            # Cek kata kunci yang cocok
-                            if value:
-                                value_str = str(value).lower()
-                                for keyword in config['keywords']:
-                                    if keyword.lower() in value_str:
-                                        if keyword not in match_data['matched_keywords']:
-                                            match_data['matched_keywords'].append(keyword)
+                            # Tentukan tingkat sensitivitas
+                            match_data['sensitivity'] = self._determine_sensitivity(match_data)
                         
-                        # Tentukan tingkat sensitivitas
-                        match_data['sensitivity'] = self._determine_sensitivity(match_data)
+                        match_data['categories'].append(category)
+                        match_data['keywords_by_category'][category] = category_keywords
+                        match_data['matched_keywords'].extend(
+                            keyword for keyword in category_keywords
+                            if keyword not in match_data['matched_keywords']
+                        )
                         
                         category_matches[category].append(match_data)
+                    
+                    # Quick mode: berhenti jika semua kategori sudah penuh
+                    if self.quick_mode and all(
+                        len(matches) >= category_limit for matches in category_matches.values()
+                    ):
+                        cursor.close()
+                        break
                         
         except Exception as e:
             print(f"   ⚠️ Error dalam tabel {table_name} untuk kategori: {e}")
         
         return category_matches
+    
+    @staticmethod
+    def _parse_json_cells(data):
+        """Parse setiap sel string berbentuk JSON ({...} atau [...]) satu kali"""
+        parsed = {}
+        for col, value in data.items():
+            if isinstance(value, str) and value.lstrip()[:1] in ('{', '['):
+                try:
+                    parsed[col] = _json_loads(value)
+                except (ValueError, RecursionError):
+                    pass
+        return parsed
+    
+    @staticmethod
+    def _quote_identifier(name):
+        """Kutip nama tabel/kolom SQLite"""
+        return '"' + name.replace('"', '""') + '"'
 
     def _determine_sensitivity(self, match_data):
         """Tentukan tingkat sensitivitas data"""
-        all_text = ""
-        for col, value in match_data['data'].items():
-            if value:
-                all_text += f" {col} {str(value)}"
-        
-        all_text = all_text.lower()
-        
-        # Cek tingkat sensitivitas
-        for keyword in self.sensitive_categories['high_sensitive']:
-            if keyword in all_text:
-                return 'high'
-        
-        for keyword in self.sensitive_categories['medium_sensitive']:
-            if keyword in all_text:
-                return 'medium'
+        all_text = ' '.join(
+            f"{col} {value}" for col, value in match_data['data'].items() if value
+        ).lower()
         
-        return 'low'
+        m = self._sens_re.match(all_text)
+        return m.lastgroup if m else 'low'
 
     def analyze_patterns(self):
         """Analisis pattern dari kata kunci yang ditemukan"""
@@ -261,6 +491,9 @@ class KeywordAnalyzer:
         
         pattern_results = {}
         
+        # Teks gabungan per baris dibangun sekali, dipakai ulang lintas pattern dan kategori
+        row_texts = {}
+        
         for category, config in self.target_keywords.items():
             print(f"\n📂 [CATEGORY] {category.title().replace('_', ' ')}")
             pattern_results[category] = {}
@@ -276,21 +509,22 @@ class KeywordAnalyzer:
             if len(matches) > 100:
                 print(f"   ⚡ Menganalisis sample 100 dari {len(matches)} items untuk performa")
             
+            sample_texts = []
+            for match in sample_matches:
+                if id(match) not in row_texts:
+                    row_texts[id(match)] = ' '.join(
+                        str(value) for value in match['data'].values() if value
+                    )
+                sample_texts.append(row_texts[id(match)])
+            
             # Analisis pattern regex (hanya 3 pattern pertama untuk performa)
-            for pattern in config['patterns'][:3]:
-                pattern_matches = []
-                for match in sample_matches:
-                    all_text = ""
-                    for col, value in match['data'].items():
-                        if value:
-                            all_text += f" {str(value)}"
-                    
-                    if re.search(pattern, all_text, re.IGNORECASE):
-                        pattern_matches.append(match)
+            compiled_patterns = self._compiled_patterns[category][:3]
+            for pattern, compiled in zip(config['patterns'][:3], compiled_patterns):
+                pattern_count = sum(1 for text in sample_texts if compiled.search(text))
                 
-                if pattern_matches:
-                    pattern_results[category][pattern] = len(pattern_matches)
-                    print(f"   🔍 Pattern '{pattern}': {len(pattern_matches)} matches")
+                if pattern_count:
+                    pattern_results[category][pattern] = pattern_count
+                    print(f"   🔍 Pattern '{pattern}': {pattern_count} matches")
             
             # Summary untuk kategori
             total_category_matches = len(matches)
@@ -327,16 +561,13 @@ class KeywordAnalyzer:
             # Cek untuk tokens
             for col, value in match['data'].items():
                 if value and isinstance(value, str):
-                    # Parse JSON jika memungkinkan
-                    try:
-                        if value.strip().startswith('{'):
-                            json_data = json.loads(value)
-                            
-                            # Extract token info
-                            self._extract_from_json(json_data, credentials_info, match['table'])
-                            
-                    except:
-                        # Cek sebagai string biasa
+                    # Gunakan hasil parse JSON dari tahap pencarian
+                    json_data = match['parsed'].get(col)
+                    if isinstance(json_data, dict):
+                        # Extract token info
+                        self._extract_from_json(json_data, credentials_info, match['table'])
+                    elif value.lstrip().startswith('{'):
+                        # JSON tidak valid: cek sebagai string biasa
                         self._extract_from_string(col, value, credentials_info, match['table'])
         
         # Tampilkan hasil
@@ -346,83 +577,83 @@ class KeywordAnalyzer:
         
         return credentials_info
 
+    @staticmethod
+    def _build_key_classifier(buckets):
+        """Bangun fungsi key -> kelompok kredensial (kelompok berprioritas tertinggi menang)"""
+        names = [bucket for bucket, _ in buckets]
+        
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for priority, (bucket, keywords) in enumerate(buckets):
+                for keyword in keywords:
+                    if automaton.exists(keyword):
+                        priority = min(priority, automaton.get(keyword))
+                    automaton.add_word(keyword, priority)
+            automaton.make_automaton()
+            
+            def classify(key_lower):
+                best = min((priority for _, priority in automaton.iter(key_lower)), default=None)
+                return None if best is None else names[best]
+            
+            return classify
+        
+        # Fallback: satu regex dengan grup bernama; lookahead agar setiap posisi dicoba
+        pattern = re.compile('(?=' + '|'.join(
+            f"(?P<{bucket}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+            for bucket, keywords in buckets
+        ) + ')')
+        priorities = {bucket: priority for priority, bucket in enumerate(names)}
+        
+        def classify(key_lower):
+            best = min((priorities[m.lastgroup] for m in pattern.finditer(key_lower)), default=None)
+            return None if best is None else names[best]
+        
+        return classify
+
+    @staticmethod
+    def _credential_entry(bucket, key, value, table_name):
+        """Buat entri informasi kredensial; token dan API key hanya disimpan preview-nya"""
+        entry = {'key': key}
+        if bucket in ('tokens', 'api_keys'):
+            value_str = str(value)
+            entry['value_preview'] = value_str[:50] + "..." if len(value_str) > 50 else value_str
+        else:
+            entry['value'] = value
+        entry['table'] = table_name
+        entry['type'] = CREDENTIAL_TYPES[bucket]
+        return entry
+
     def _extract_from_json(self, json_data, credentials_info, table_name):
         """Extract informasi dari data JSON"""
-        if isinstance(json_data, dict):
-            for key, value in json_data.items():
-                key_lower = key.lower()
-                
-                # Token detection
-                if any(keyword in key_lower for keyword in ['token', 'access', 'refresh', 'bearer']):
-                    credentials_info['tokens'].append({
-                        'key': key,
-                        'value_preview': str(value)[:50] + "..." if len(str(value)) > 50 else str(value),
-                        'table': table_name,
-                        'type': 'token'
-                    })
-                
-                # API Key detection
-                elif any(keyword in key_lower for keyword in ['api', 'key', 'secret']):
-                    credentials_info['api_keys'].append({
-                        'key': key,
-                        'value_preview': str(value)[:50] + "..." if len(str(value)) > 50 else str(value),
-                        'table': table_name,
-                        'type': 'api_key'
-                    })
-                
-                # User ID detection
-                elif any(keyword in key_lower for keyword in ['userid', 'user_id', 'uid']):
-                    credentials_info['user_ids'].append({
-                        'key': key,
-                        'value': value,
-                        'table': table_name,
-                        'type': 'user_id'
-                    })
-                
-                # Subscription info
-                elif any(keyword in key_lower for keyword in ['plan', 'subscription', 'trial', 'premium', 'pro']):
-                    credentials_info['subscription_info'].append({
-                        'key': key,
-                        'value': value,
-                        'table': table_name,
-                        'type': 'subscription'
-                    })
+        if not isinstance(json_data, dict):
+            return
+        
+        # Stack iterator (bukan rekursi) agar urutan tetap depth-first seperti sebelumnya
+        stack = [iter(json_data.items())]
+        while stack:
+            for key, value in stack[-1]:
+                bucket = self._classify_json_key(key.lower())
                 
-                # Account status
-                elif any(keyword in key_lower for keyword in ['status', 'active', 'enabled']):
-                    credentials_info['account_status'].append({
-                        'key': key,
-                        'value': value,
-                        'table': table_name,
-                        'type': 'status'
-                    })
+                if bucket is not None:
+                    credentials_info[bucket].append(
+                        self._credential_entry(bucket, key, value, table_name)
+                    )
                 
-                # Rekursif untuk nested objects
+                # Masuk ke nested object, lanjutkan sisa key setelahnya
                 elif isinstance(value, dict):
-                    self._extract_from_json(value, credentials_info, table_name)
+                    stack.append(iter(value.items()))
+                    break
+            else:
+                stack.pop()
 
     def _extract_from_string(self, col, value, credentials_info, table_name):
         """Extract informasi dari string biasa"""
-        col_lower = col.lower()
-        value_str = str(value)
+        bucket = self._classify_column(col.lower())
         
-        # Token detection
-        if any(keyword in col_lower for keyword in ['token', 'access', 'refresh']):
-            credentials_info['tokens'].append({
-                'key': col,
-                'value_preview': value_str[:50] + "..." if len(value_str) > 50 else value_str,
-                'table': table_name,
-                'type': 'token'
-            })
-        
-        # User ID detection
-        elif any(keyword in col_lower for keyword in ['userid', 'user_id']):
-            credentials_info['user_ids'].append({
-                'key': col,
-                'value': value,
-                'table': table_name,
-                'type': 'user_id'
-            })
+        if bucket is not None:
+            credentials_info[bucket].append(
+                self._credential_entry(bucket, col, value, table_name)
+            )
 
     def display_detailed_results(self, max_items_per_category=3):
         """Tampilkan hasil detail dengan format yang mudah dibaca"""
@@ -452,20 +683,23 @@ class KeywordAnalyzer:
             
             for i, match in enumerate(priority_items, 1):
                 sensitivity_icon = {"high": "🔴", "medium": "🟡", "low": "🟢"}[match['sensitivity']]
+                matched_keywords = match['keywords_by_category'][category]
                 print(f"\n   📄 [ITEM {i}] {sensitivity_icon} Table: {match['table']}")
-                print(f"      🏷️  Matched Keywords: {', '.join(match['matched_keywords'])}")
+                print(f"      🏷️  Matched Keywords: {', '.join(matched_keywords)}")
                 
                 for col, value in match['data'].items():
-                    if value and any(keyword.lower() in str(value).lower() for keyword in match['matched_keywords']):
-                        formatted_value = self._format_value(value, match['sensitivity'])
+                    if value and any(keyword.lower() in str(value).lower() for keyword in matched_keywords):
+                        formatted_value = self._format_value(
+                            value, match['sensitivity'], match['parsed'].get(col)
+                        )
                         print(f"      🔑 {col}:")
                         print(f"         {formatted_value}")
             
             if len(matches) > max_items_per_category:
                 print(f"   ⚠️  ... dan {len(matches) - max_items_per_category} item lainnya")
 
-    def _format_value(self, value, sensitivity='low'):
-        """Format nilai berdasarkan tingkat sensitivitas"""
+    def _format_value(self, value, sensitivity='low', parsed=None):
+        """Format nilai berdasarkan tingkat sensitivitas (parsed: hasil parse JSON dari cache)"""
         if value is None:
             return "NULL"
         
@@ -478,17 +712,13 @@ class KeywordAnalyzer:
             elif len(value_str) > 10:
                 return f"{value_str[:5]}***[DISENSOR]***"
         
-        # Coba parse sebagai JSON
-        try:
-            if value_str.strip().startswith(("{", "[")):
-                parsed = json.loads(value_str)
-                formatted = json.dumps(parsed, indent=2, ensure_ascii=False)
-                
-                if len(formatted) > 600:
-                    return formatted[:600] + "\n         ... [JSON DIPOTONG]"
-                return formatted
-        except:
-            pass
+        # Sel JSON sudah di-parse sekali saat pencarian (match['parsed'])
+        if parsed is not None:
+            formatted = self._json_encoder.encode(parsed)
+            
+            if len(formatted) > 600:
+                return formatted[:600] + "\n         ... [JSON DIPOTONG]"
+            return formatted
         
         # Untuk string biasa
         if len(value_str) > 200:
@@ -502,58 +732,36 @@ class KeywordAnalyzer:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = f"keyword_analysis_{timestamp}.json"
         
-        export_data = {
-            'analysis_info': {
-                'database_file': self.db_path,
-                'analysis_date': datetime.now().isoformat(),
-                'total_matches': len(self.results['raw_data']),
-                'include_sensitive_data': include_sensitive
-            },
-            'summary': {
-                'categories': {cat: len(matches) for cat, matches in self.results['keywords'].items()}
-            },
-            'detailed_results': {}
+        analysis_info = {
+            'database_file': self.db_path,
+            'analysis_date': datetime.now().isoformat(),
+            'total_matches': len(self.results['raw_data']),
+            'include_sensitive_data': include_sensitive
+        }
+        summary = {
+            'categories': {cat: len(matches) for cat, matches in self.results['keywords'].items()}
         }
-        
-        # Export detailed results
-        for category, matches in self.results['keywords'].items():
-            if matches:
-                category_data = []
-                for match in matches:
-                    # Filter data sensitif jika diperlukan
-                    if not include_sensitive and match['sensitivity'] == 'high':
-                        match_data = {
-                            'table': match['table'],
-                            'category': match['category'],
-                            'matched_keywords': match['matched_keywords'],
-                            'sensitivity': match['sensitivity'],
-                            'data': {'[SENSITIVE DATA FILTERED]': 'Use include_sensitive=True to export'}
-                        }
-                    else:
-                        match_data = {
-                            'table': match['table'],
-                            'category': match['category'],
-                            'matched_keywords': match['matched_keywords'],
-                            'sensitivity': match['sensitivity'],
-                            'data': {}
-                        }
-                        
-                        for col, value in match['data'].items():
-                            if isinstance(value, str) and value.strip().startswith(("{", "[")):
-                                try:
-                                    match_data['data'][col] = json.loads(value)
-                                except:
-                                    match_data['data'][col] = value
-                            else:
-                                match_data['data'][col] = value
-                    
-                    category_data.append(match_data)
-                
-                export_data['detailed_results'][category] = category_data
         
         try:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            # Tulis bertahap: hanya satu entri hasil yang dibentuk di memori setiap saat
+            with open(output_file, 'wb', buffering=1 << 20) as f:
+                f.write(b'{\n  "analysis_info": ' + _dumps(analysis_info) + b',\n')
+                f.write(b'  "summary": ' + _dumps(summary) + b',\n')
+                f.write(b'  "detailed_results": {')
+                
+                separator = b'\n'
+                for category, matches in self.results['keywords'].items():
+                    if not matches:
+                        continue
+                    f.write(separator + b'    ' + _dumps(category) + b': [\n')
+                    _stream_json(f, (
+                        self._export_entry(match, category, include_sensitive)
+                        for match in matches
+                    ))
+                    f.write(b'\n    ]')
+                    separator = b',\n'
+                
+                f.write(b'\n  }\n}\n')
             
             print(f"\n💾 [EXPORT] Hasil berhasil diexport ke: {output_file}")
             if not include_sensitive:
@@ -563,6 +771,27 @@ class KeywordAnalyzer:
             print(f"❌ [ERROR] Gagal export: {e}")
             return None
 
+    @staticmethod
+    def _export_entry(match, category, include_sensitive):
+        """Bentuk satu entri export untuk baris yang cocok dalam kategori tertentu"""
+        entry = {
+            'table': match['table'],
+            'category': category,
+            'matched_keywords': match['keywords_by_category'][category],
+            'sensitivity': match['sensitivity']
+        }
+        
+        # Filter data sensitif jika diperlukan
+        if not include_sensitive and match['sensitivity'] == 'high':
+            entry['data'] = {'[SENSITIVE DATA FILTERED]': 'Use include_sensitive=True to export'}
+        else:
+            # Sel JSON sudah di-parse saat pencarian
+            entry['data'] = {
+                col: match['parsed'].get(col, value) for col, value in match['data'].items()
+            }
+        
+        return entry
+
     def generate_security_report(self):
         """Generate laporan keamanan"""
         print("\n" + "="*80)
@@ -603,6 +832,15 @@ class KeywordAnalyzer:
         print("="*80)
 
 def main():
+    # Jika output dialihkan ke file/pipe, buffer per blok: ratusan print() tidak
+    # lagi flush satu per satu. Flush dilakukan eksplisit di batas setiap tahap
+    # analisis. Di terminal tetap per baris agar progres per tabel langsung terlihat.
+    try:
+        if not sys.stdout.isatty():
+            sys.stdout.reconfigure(line_buffering=False, write_through=False)
+    except (AttributeError, ValueError):
+        pass
+    
     print("🎯 [KEYWORD ANALYZER] Script Analisis Kata Kunci Spesifik")
     print("=" * 60)
     print("🔍 Target: token, max mode, kredensial, status akun, pro plan, pro trial")
@@ -670,6 +908,7 @@ def main():
         
         # 1. Cari semua kata kunci
         analyzer.search_keywords()
+        sys.stdout.flush()
         
         if len(analyzer.results['raw_data']) == 0:
             print("\n❌ [RESULT] Tidak ada kata kunci target ditemukan")
@@ -677,15 +916,19 @@ def main():
         
         # 2. Analisis pattern
         pattern_results = analyzer.analyze_patterns()
+        sys.stdout.flush()
         
         # 3. Extract kredensial info
         credentials_info = analyzer.extract_credentials_info()
+        sys.stdout.flush()
         
         # 4. Tampilkan hasil detail
         analyzer.display_detailed_results()
+        sys.stdout.flush()
         
         # 5. Generate security report
         analyzer.generate_security_report()
+        sys.stdout.flush()
         
         # 6. Export hasil
         print("\n💾 [EXPORT OPTIONS]")
@@ -714,6 +957,7 @@ def main():
     
     finally:
         analyzer.close()
+        sys.stdout.flush()
 
 if __name__ == "__main__":
     main()
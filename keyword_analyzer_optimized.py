@@ -5,25 +5,109 @@ Menggunakan batching, optimasi query, dan progress yang lebih baik
 Author: AI Assistant
 """
 
+import argparse
 import sqlite3
 import json
 import os
 import sys
 from datetime import datetime
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from math import isfinite
+from pathlib import Path
 import re
 import time
 
+# pyahocorasick opsional: semua kata kunci dicari dalam satu pemindaian per sel
+try:
+    import ahocorasick
+
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson opsional: parsing dan serialisasi JSON jauh lebih cepat untuk export besar
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# msgpack opsional: format export biner yang lebih kecil dan cepat dari JSON
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+EXPORT_FORMATS = ("json", "msgpack")
+
+
+# orjson membaca integer >= 19 digit (di luar int64/uint64) sebagai float tanpa
+# error; teks dengan deret digit sepanjang ini di-parse json standar.
+# translate() memetakan digit ke "0" dan karakter lain ke spasi
+_DIGIT_MASK = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity: orjson menulisnya sebagai null, json standar sebagai NaN/Infinity"""
+
+    __slots__ = ()
+
+
+def _parse_float(text):
+    """parse_float json standar: float tak hingga (mis. 1e999) ditandai _NonFiniteFloat"""
+    value = float(text)
+    return value if isfinite(value) else _NonFiniteFloat(value)
+
+
+def _json_loads(text):
+    """Parse JSON (orjson jika tersedia)"""
+    if ORJSON_AVAILABLE:
+        encoded = text.encode("utf-8", "surrogatepass")
+        if _LONG_DIGIT_RUN not in encoded.translate(_DIGIT_MASK):
+            try:
+                return orjson.loads(encoded)
+            except orjson.JSONDecodeError:
+                # orjson menolak NaN/Infinity dan angka di luar jangkauan double
+                pass
+    return json.loads(text, parse_float=_parse_float, parse_constant=_NonFiniteFloat)
+
+
+def _orjson_default(obj):
+    """default orjson: NaN/Infinity dilempar balik agar _dumps memakai json standar"""
+    if isinstance(obj, _NonFiniteFloat):
+        raise TypeError("non-finite float")
+    return str(obj)
+
+
+def _dumps(obj):
+    """Serialisasi objek ke bytes JSON ringkas (orjson jika tersedia)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # Integer > 64-bit atau NaN/Infinity; json standar menulisnya apa adanya
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=str).encode("utf-8")
+
 
 class OptimizedKeywordAnalyzer:
-    def __init__(self, db_path, batch_size=500):
+    def __init__(self, db_path, batch_size=500, jobs=8):
         self.db_path = db_path
         self.conn = None
         self.batch_size = batch_size
+        self.jobs = max(1, jobs)
         self.results = {
             "keywords": {},
             "summary": {},
-            "raw_data": [],
+            "table_schemas": {},
             "total_processed": 0,
         }
 
@@ -69,8 +153,62 @@ class OptimizedKeywordAnalyzer:
             },
         }
 
-        # Cache untuk menghindari query berulang
-        self.query_cache = {}
+        # Gabungan semua kata kunci (lowercase, tanpa duplikat) untuk filter SQL
+        self.all_keywords = list(
+            dict.fromkeys(
+                keyword.lower()
+                for config in self.target_keywords.values()
+                for keyword in config["keywords"]
+            )
+        )
+
+        # Pola LIKE terikat untuk filter SQL, dan query per tabel yang sudah jadi
+        self._like_patterns = [f"%{keyword}%" for keyword in self.all_keywords]
+        self._search_queries = {}
+
+        # Penanda sensitivitas, dikompilasi sekali menjadi satu regex per tingkat
+        high_sensitive_keywords = [
+            "token",
+            "password",
+            "key",
+            "secret",
+            "credential",
+            "auth",
+        ]
+        self._high_sensitive_re = re.compile("|".join(high_sensitive_keywords))
+        self._medium_sensitive_re = re.compile("userid|email|api")
+
+        # Kata kunci target yang sendirinya sudah menandakan data high sensitive
+        self._high_keywords = {
+            keyword
+            for config in self.target_keywords.values()
+            for keyword in config["keywords"]
+            if self._high_sensitive_re.search(keyword.lower())
+        }
+
+        # Kata kunci per kategori berpasangan dengan bentuk lowercase-nya
+        self._category_keywords = {
+            category: [(keyword, keyword.lower()) for keyword in config["keywords"]]
+            for category, config in self.target_keywords.items()
+        }
+
+        # Memo sensitivitas per teks baris dan hasil per nama kolom (lihat
+        # _process_batch dan _extract_key_info). Kunci memo sensitivitas adalah
+        # 500 karakter pertama sel-sel baris (huruf kecil) yang digabung spasi,
+        # bukan tuple baris: baris yang sama di 500 karakter pertama berbagi hasil
+        self._data_sensitivity = lru_cache(maxsize=8192)(self._scan_data_sensitivity)
+        self._key_columns = {}
+
+        # Tuple matched_keywords yang di-intern, dipakai bersama oleh semua match
+        self._keyword_tuples = {}
+
+        # Automaton Aho-Corasick untuk semua kata kunci sekaligus
+        self.automaton = None
+        if AHOCORASICK_AVAILABLE:
+            self.automaton = ahocorasick.Automaton()
+            for keyword in self.all_keywords:
+                self.automaton.add_word(keyword, keyword)
+            self.automaton.make_automaton()
 
     def connect(self):
         """Koneksi ke database SQLite dengan optimasi"""
@@ -79,12 +217,9 @@ class OptimizedKeywordAnalyzer:
                 print(f"❌ [ERROR] File tidak ditemukan: {self.db_path}")
                 return False
 
-            # Optimasi koneksi SQLite
-            self.conn = sqlite3.connect(self.db_path)
-            self.conn.execute("PRAGMA journal_mode = WAL")  # Optimasi performa
-            self.conn.execute("PRAGMA synchronous = NORMAL")
-            self.conn.execute("PRAGMA cache_size = 10000")
-            self.conn.execute("PRAGMA temp_store = memory")
+            # Optimasi koneksi SQLite: read-only, jadi journal_mode/synchronous
+            # tidak relevan dan database pengguna tidak pernah diubah
+            self.conn = self._open_readonly_connection()
 
             print(f"✅ [SUCCESS] Berhasil terhubung ke database: {self.db_path}")
 
@@ -99,6 +234,45 @@ class OptimizedKeywordAnalyzer:
             print(f"❌ [ERROR] Gagal terhubung: {e}")
             return False
 
+    def iter_matches(self):
+        """Semua match dari semua kategori (tanpa salinan daftar terpisah)"""
+        return chain.from_iterable(self.results["keywords"].values())
+
+    def count_matches(self):
+        """Jumlah total match dari semua kategori"""
+        return sum(len(matches) for matches in self.results["keywords"].values())
+
+    def _open_readonly_connection(self):
+        """Koneksi read-only; worker thread masing-masing membuka koneksi sendiri"""
+        # Tanpa immutable=1: Cursor bisa sedang menulis ke file ini dan isi WAL-nya
+        # harus tetap terbaca
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        self._apply_read_pragmas(conn)
+        return conn
+
+    @staticmethod
+    def _apply_read_pragmas(conn):
+        """PRAGMA untuk beban kerja baca: cache 64 MiB, mmap 256 MB, tanpa penulisan"""
+        # page_size tidak diubah: hanya berlaku setelah VACUUM, yang menulis ulang
+        # database milik pengguna
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA temp_store = memory")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA query_only = 1")
+        # Filter pencarian mengandalkan LIKE yang case-insensitive (default SQLite)
+        conn.execute("PRAGMA case_sensitive_like = OFF")
+
+    def _search_table_worker(self, table_name):
+        """Cari satu tabel dengan koneksi sendiri, kembalikan hasil dan durasinya"""
+        table_start = time.time()
+        conn = self._open_readonly_connection()
+        try:
+            table_matches = self._search_table_optimized(table_name, conn)
+        finally:
+            conn.close()
+        return table_matches, time.time() - table_start
+
     def close(self):
         """Tutup koneksi database"""
         if self.conn:
@@ -124,12 +298,28 @@ class OptimizedKeywordAnalyzer:
 
         total_matches = 0
 
-        for table_name in tables:
+        # Tabel dipindai paralel, masing-masing dengan koneksi read-only sendiri.
+        # Hasil digabung setelah semua selesai, sesuai urutan tabel, sehingga
+        # tidak perlu lock dan output tetap deterministik.
+        if tables:
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(tables))) as executor:
+                table_results = list(
+                    executor.map(self._search_table_worker, tables)
+                )
+        else:
+            table_results = []
+
+        # Urutkan skema sesuai urutan tabel (worker mengisinya sesuai urutan selesai)
+        table_schemas = self.results["table_schemas"]
+        self.results["table_schemas"] = {
+            table_name: table_schemas[table_name]
+            for table_name in tables
+            if table_name in table_schemas
+        }
+
+        for table_name, (table_matches, table_time) in zip(tables, table_results):
             print(f"\n🔍 [TABLE] Menganalisa tabel: {table_name}")
-            table_start = time.time()
 
-            # Gunakan query yang dioptimasi untuk setiap tabel
-            table_matches = self._search_table_optimized(table_name)
             table_total = sum(len(matches) for matches in table_matches.values())
             total_matches += table_total
 
@@ -137,9 +327,7 @@ class OptimizedKeywordAnalyzer:
                 # Gabungkan hasil
                 for category, matches in table_matches.items():
                     self.results["keywords"][category].extend(matches)
-                    self.results["raw_data"].extend(matches)
 
-                table_time = time.time() - table_start
                 print(
                     f"   ✅ Ditemukan {table_total} hasil dalam {table_time:.1f} detik"
                 )
@@ -160,53 +348,39 @@ class OptimizedKeywordAnalyzer:
                     f"   📁 {category.title().replace('_', ' ')}: {len(matches)} item"
                 )
 
-    def _search_table_optimized(self, table_name):
+    def _search_table_optimized(self, table_name, conn=None):
         """Pencarian optimized per tabel"""
-        cursor = self.conn.cursor()
+        cursor = (conn or self.conn).cursor()
         category_matches = {category: [] for category in self.target_keywords}
 
         try:
-            # Dapatkan info kolom (cached)
-            cache_key = f"columns_{table_name}"
-            if cache_key in self.query_cache:
-                columns = self.query_cache[cache_key]
+            # Dapatkan info kolom (cached); disimpan sekali per tabel di
+            # table_schemas, bukan di setiap match
+            table_schemas = self.results["table_schemas"]
+            if table_name in table_schemas:
+                columns = table_schemas[table_name]
             else:
-                cursor.execute(f"PRAGMA table_info({table_name})")
+                cursor.execute(f"PRAGMA table_info({self._quote_identifier(table_name)})")
                 columns = [col[1] for col in cursor.fetchall()]
-                self.query_cache[cache_key] = columns
-
-            # Gunakan UNION untuk menggabungkan queries dan mengurangi I/O
-            all_conditions = []
-
-            for category, config in self.target_keywords.items():
-                # Fokus pada kata kunci prioritas dulu
-                priority_keywords = config.get("priority", config["keywords"][:3])
-
-                for keyword in priority_keywords:
-                    for col in columns:
-                        condition = f"LOWER({col}) LIKE '%{keyword.lower()}%'"
-                        all_conditions.append(
-                            f"({condition}) as match_{category}_{keyword.replace(' ', '_')}"
-                        )
-
-            # Query optimized dengan batching
-            base_query = (
-                f"SELECT *, " + ", ".join(all_conditions) + f" FROM {table_name}"
-            )
+                table_schemas[table_name] = columns
 
-            # Eksekusi dengan batching untuk menghindari memory issues
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            total_rows = cursor.fetchone()[0]
+            # SQL dan parameter dibangun sekali per tabel; teks SQL yang sama
+            # memakai ulang prepared statement dari cache sqlite3
+            base_query, query_params = self._build_search_query(table_name, columns)
 
+            # Eksekusi dengan batching untuk menghindari memory issues.
+            # Tanpa SELECT COUNT(*) lebih dulu: itu pemindaian penuh tambahan
+            # hanya untuk persentase progress.
             processed = 0
             batch_num = 0
 
-            while processed < total_rows:
-                offset = processed
-                batch_query = f"{base_query} LIMIT {self.batch_size} OFFSET {offset}"
+            # Satu statement, dibaca per batch; LIMIT/OFFSET membuat SQLite
+            # memindai ulang semua baris sebelumnya di setiap batch
+            cursor.arraysize = self.batch_size
+            cursor.execute(base_query, query_params)
 
-                cursor.execute(batch_query)
-                batch_rows = cursor.fetchall()
+            while True:
+                batch_rows = cursor.fetchmany()
 
                 if not batch_rows:
                     break
@@ -218,9 +392,8 @@ class OptimizedKeywordAnalyzer:
                 batch_num += 1
 
                 # Progress indicator
-                progress = (processed / total_rows) * 100
                 print(
-                    f"   📊 Batch {batch_num}: {processed}/{total_rows} ({progress:.1f}%)"
+                    f"   📊 [{table_name}] Batch {batch_num}: {processed} baris cocok diproses"
                 )
 
         except Exception as e:
@@ -228,66 +401,114 @@ class OptimizedKeywordAnalyzer:
 
         return category_matches
 
+    def _build_search_query(self, table_name, columns):
+        """Bangun (dan cache) query pencarian beserta parameternya untuk satu tabel"""
+        cached = self._search_queries.get(table_name)
+        if cached is not None:
+            return cached
+
+        # Nama tabel/kolom dikutip: SQLite mengizinkan spasi, kata kunci SQL,
+        # bahkan tanda kutip di dalam nama
+        quoted_table = self._quote_identifier(table_name)
+        quoted_columns = [self._quote_identifier(col) for col in columns]
+
+        # Filter di SQL: hanya baris yang memuat salah satu kata kunci yang
+        # dikirim ke Python. Nilai LIKE diikat sebagai parameter; LIKE bawaan
+        # SQLite sudah case-insensitive untuk ASCII sehingga tidak perlu LOWER()
+        #
+        # Catatan: indeks FTS5 sengaja tidak dipakai. Tokenizer kata tidak bisa
+        # mencari substring (mis. 'token' di 'accessToken'), tokenizer trigram
+        # tidak bisa mencari kata kunci 2 huruf ('ai'), dan membangun indeks
+        # butuh pemindaian penuh yang lebih mahal dari satu scan LIKE ini.
+        where_conditions = []
+        where_params = []
+        for pattern in self._like_patterns:
+            for col in quoted_columns:
+                where_conditions.append(f"{col} LIKE ?")
+                where_params.append(pattern)
+        where_clause = " WHERE " + " OR ".join(where_conditions)
+
+        # Query optimized dengan batching; hanya kolom asli, pencocokan per
+        # kategori dilakukan di _process_batch
+        base_query = f"SELECT * FROM {quoted_table}" + where_clause
+
+        cached = self._search_queries[table_name] = (base_query, where_params)
+        return cached
+
+    @staticmethod
+    def _quote_identifier(name):
+        """Kutip nama tabel/kolom SQLite dengan aman"""
+        return '"' + name.replace('"', '""') + '"'
+
     def _process_batch(self, rows, columns, category_matches, table_name):
         """Proses batch data untuk efisiensi"""
         for row in rows:
-            # Ambil data utama (tanpa kolom match indicator)
-            main_data = row[: len(columns)]
+            # Setiap sel di-lowercase sekali, lalu dipindai sekali untuk semua kata kunci
+            lower_cells = [str(value).lower() for value in row if value]
+            cell_hits = [self._find_keywords(cell) for cell in lower_cells]
+            if not any(cell_hits):
+                continue
+
+            # Dihitung paling banyak sekali per baris lalu dibagi semua kategori
+            data = None
+            data_sensitivity = None
 
             # Tentukan kategori yang cocok berdasarkan isi data
-            for category, config in self.target_keywords.items():
+            for category, keywords in self._category_keywords.items():
                 matched_keywords = []
 
-                # Cek apakah ada kata kunci yang cocok
-                for col, value in zip(columns, main_data):
-                    if value:
-                        value_str = str(value).lower()
-                        for keyword in config["keywords"]:
-                            if keyword.lower() in value_str:
-                                if keyword not in matched_keywords:
-                                    matched_keywords.append(keyword)
-
-                # Jika ada match, buat data entry
-                if matched_keywords:
-                    match_data = {
+                # Urutan: per kolom, lalu sesuai urutan kata kunci kategori
+                for hits in cell_hits:
+                    for keyword, keyword_lower in keywords:
+                        if keyword_lower in hits and keyword not in matched_keywords:
+                            matched_keywords.append(keyword)
+
+                if not matched_keywords:
+                    continue
+
+                # Kombinasi kata kunci sangat berulang: simpan satu tuple bersama
+                matched_keywords = tuple(matched_keywords)
+                matched_keywords = self._keyword_tuples.setdefault(
+                    matched_keywords, matched_keywords
+                )
+
+                if data is None:
+                    data = dict(zip(columns, row))
+
+                # Sensitivitas: kata kunci high menentukan langsung, selain itu
+                # bergantung pada isi baris saja
+                if not self._high_keywords.isdisjoint(matched_keywords):
+                    sensitivity = "high"
+                else:
+                    if data_sensitivity is None:
+                        data_sensitivity = self._data_sensitivity(
+                            # Kunci memo = 500 karakter pertama; sama seperti
+                            # sebelumnya, sisa baris tidak ikut dinilai
+                            " ".join(lower_cells)[:500]
+                        )
+                    sensitivity = data_sensitivity
+
+                category_matches[category].append(
+                    {
                         "table": table_name,
                         "category": category,
-                        "columns": columns,
-                        "data": {col: val for col, val in zip(columns, main_data)},
+                        "data": data,
                         "matched_keywords": matched_keywords,
-                        "sensitivity": self._determine_sensitivity_fast(
-                            matched_keywords, main_data
-                        ),
+                        "sensitivity": sensitivity,
                     }
+                )
 
-                    category_matches[category].append(match_data)
-
-    def _determine_sensitivity_fast(self, matched_keywords, data_row):
-        """Penentuan sensitivitas yang lebih cepat"""
-        high_sensitive_keywords = [
-            "token",
-            "password",
-            "key",
-            "secret",
-            "credential",
-            "auth",
-        ]
-
-        # Cek kata kunci yang cocok
-        for keyword in matched_keywords:
-            if any(
-                sensitive in keyword.lower() for sensitive in high_sensitive_keywords
-            ):
-                return "high"
-
-        # Cek isi data secara cepat
-        data_str = " ".join(str(item) for item in data_row if item)[
-            :500
-        ].lower()  # Limit untuk performa
+    def _find_keywords(self, value_lower):
+        """Himpunan kata kunci (lowercase) yang muncul dalam teks"""
+        if self.automaton is not None:
+            return {keyword for _, keyword in self.automaton.iter(value_lower)}
+        return {keyword for keyword in self.all_keywords if keyword in value_lower}
 
-        if any(sensitive in data_str for sensitive in high_sensitive_keywords):
+    def _scan_data_sensitivity(self, data_str):
+        """Tingkat sensitivitas berdasarkan isi data (teks baris, sudah lowercase)"""
+        if self._high_sensitive_re.search(data_str):
             return "high"
-        elif any(keyword in data_str for keyword in ["userid", "email", "api"]):
+        elif self._medium_sensitive_re.search(data_str):
             return "medium"
 
         return "low"
@@ -354,12 +575,15 @@ class OptimizedKeywordAnalyzer:
         # Extract info penting dari data
         for col, value in match["data"].items():
             if value:
-                # Cek untuk info kredensial
-                col_lower = col.lower()
-                if any(
-                    keyword in col_lower
-                    for keyword in ["user", "id", "token", "key", "plan"]
-                ):
+                # Cek untuk info kredensial (hasil per nama kolom di-cache)
+                is_key_column = self._key_columns.get(col)
+                if is_key_column is None:
+                    col_lower = col.lower()
+                    is_key_column = self._key_columns[col] = any(
+                        keyword in col_lower
+                        for keyword in ["user", "id", "token", "key", "plan"]
+                    )
+                if is_key_column:
                     if isinstance(value, str) and len(value) > 50:
                         # Preview untuk data panjang
                         key_info["summary"][
@@ -376,13 +600,19 @@ class OptimizedKeywordAnalyzer:
         print("📊 [COMPREHENSIVE REPORT] LAPORAN LENGKAP ANALISIS")
         print("=" * 80)
 
-        total_matches = len(self.results["raw_data"])
-        high_sensitive = len(
-            [m for m in self.results["raw_data"] if m.get("sensitivity") == "high"]
-        )
-        medium_sensitive = len(
-            [m for m in self.results["raw_data"] if m.get("sensitivity") == "medium"]
+        # Satu pass untuk semua hitungan sensitivitas (total dan per kategori)
+        sensitivity_by_category = Counter(
+            (category, match.get("sensitivity"))
+            for category, matches in self.results["keywords"].items()
+            for match in matches
         )
+        sensitivity_counts = Counter()
+        for (_, sensitivity), count in sensitivity_by_category.items():
+            sensitivity_counts[sensitivity] += count
+
+        total_matches = self.count_matches()
+        high_sensitive = sensitivity_counts["high"]
+        medium_sensitive = sensitivity_counts["medium"]
 
         print(f"🗃️  Database: {self.db_path}")
         print(f"📅 Tanggal analisis: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -408,9 +638,7 @@ class OptimizedKeywordAnalyzer:
             self.results["keywords"].items(), key=lambda x: len(x[1]), reverse=True
         ):
             if matches:
-                high_in_cat = len(
-                    [m for m in matches if m.get("sensitivity") == "high"]
-                )
+                high_in_cat = sensitivity_by_category[(category, "high")]
                 percentage = (len(matches) / total_matches) * 100
                 print(
                     f"   • {category.title().replace('_', ' ')}: {len(matches):,} ({percentage:.1f}%) | {high_in_cat:,} high sensitive"
@@ -420,30 +648,42 @@ class OptimizedKeywordAnalyzer:
         print(f"\n🏆 TOP KEYWORDS PER KATEGORI:")
         for category, matches in self.results["keywords"].items():
             if matches:
-                keyword_count = defaultdict(int)
-                for match in matches:
-                    for keyword in match.get("matched_keywords", []):
-                        keyword_count[keyword] += 1
-
-                top_keywords = sorted(
-                    keyword_count.items(), key=lambda x: x[1], reverse=True
-                )[:5]
+                top_keywords = Counter(
+                    keyword
+                    for match in matches
+                    for keyword in match.get("matched_keywords", ())
+                ).most_common(5)
                 print(f"   📁 {category.title().replace('_', ' ')}:")
                 for keyword, count in top_keywords:
                     print(f"      - {keyword}: {count:,} occurrences")
 
-    def export_comprehensive_results(self, output_file=None, include_sensitive=False):
+    def export_comprehensive_results(
+        self, output_file=None, include_sensitive=False, export_format="json"
+    ):
         """Export hasil lengkap dengan struktur yang optimal"""
+        if export_format not in EXPORT_FORMATS:
+            print(f"❌ [ERROR] Format export tidak dikenal: {export_format}")
+            return None
+        if export_format == "msgpack" and not MSGPACK_AVAILABLE:
+            print("⚠️  [WARNING] msgpack tidak terpasang - export sebagai JSON")
+            export_format = "json"
+
         if not output_file:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_file = f"comprehensive_keyword_analysis_{timestamp}.json"
+            output_file = f"comprehensive_keyword_analysis_{timestamp}.{export_format}"
+
+        # Satu pass untuk total dan distribusi sensitivitas
+        sensitivity_counts = Counter(
+            match.get("sensitivity") for match in self.iter_matches()
+        )
+        total_matches = sum(sensitivity_counts.values())
 
         # Struktur export yang optimized
         export_data = {
             "analysis_info": {
                 "database_file": self.db_path,
                 "analysis_date": datetime.now().isoformat(),
-                "total_matches": len(self.results["raw_data"]),
+                "total_matches": total_matches,
                 "batch_size_used": self.batch_size,
                 "include_sensitive_data": include_sensitive,
             },
@@ -453,84 +693,25 @@ class OptimizedKeywordAnalyzer:
                     for cat, matches in self.results["keywords"].items()
                 },
                 "sensitivity_distribution": {
-                    "high": len(
-                        [
-                            m
-                            for m in self.results["raw_data"]
-                            if m.get("sensitivity") == "high"
-                        ]
-                    ),
-                    "medium": len(
-                        [
-                            m
-                            for m in self.results["raw_data"]
-                            if m.get("sensitivity") == "medium"
-                        ]
-                    ),
-                    "low": len(
-                        [
-                            m
-                            for m in self.results["raw_data"]
-                            if m.get("sensitivity") == "low"
-                        ]
-                    ),
+                    level: sensitivity_counts[level]
+                    for level in ("high", "medium", "low")
                 },
             },
-            "detailed_results": {},
+            "table_schemas": self.results["table_schemas"],
         }
 
         # Export results dengan batching untuk file besar
-        print(f"\n💾 [EXPORT] Mengexport {len(self.results['raw_data']):,} items...")
-
-        for category, matches in self.results["keywords"].items():
-            if matches:
-                print(f"   📁 Exporting {category}: {len(matches):,} items...")
+        print(f"\n💾 [EXPORT] Mengexport {total_matches:,} items...")
 
-                category_data = []
-                for i, match in enumerate(matches):
-                    # Progress untuk kategori besar
-                    if i % 1000 == 0 and i > 0:
-                        print(f"      📊 Progress: {i:,}/{len(matches):,}")
-
-                    # Filter data sensitif jika diperlukan
-                    if not include_sensitive and match.get("sensitivity") == "high":
-                        match_data = {
-                            "table": match["table"],
-                            "category": match["category"],
-                            "matched_keywords": match["matched_keywords"],
-                            "sensitivity": match["sensitivity"],
-                            "data_summary": f"[FILTERED - {len(match['data'])} sensitive fields]",
-                        }
-                    else:
-                        match_data = {
-                            "table": match["table"],
-                            "category": match["category"],
-                            "matched_keywords": match["matched_keywords"],
-                            "sensitivity": match["sensitivity"],
-                            "data": {},
-                        }
-
-                        # Process data dengan JSON parsing
-                        for col, value in match["data"].items():
-                            if isinstance(value, str) and value.strip().startswith(
-                                ("{", "[")
-                            ):
-                                try:
-                                    match_data["data"][col] = json.loads(value)
-                                except:
-                                    match_data["data"][col] = value
-                            else:
-                                match_data["data"][col] = value
-
-                    category_data.append(match_data)
-
-                export_data["detailed_results"][category] = category_data
-
-        # Simpan dengan kompresi untuk file besar
+        # Tulis bertahap: header dulu, lalu setiap entri satu per satu, sehingga
+        # hanya satu entri yang dibentuk di memori setiap saat
         try:
             print(f"   💽 Writing to file: {output_file}")
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_file, "wb", buffering=1 << 20) as f:
+                if export_format == "msgpack":
+                    self._write_msgpack_export(f, export_data, include_sensitive)
+                else:
+                    self._write_json_export(f, export_data, include_sensitive)
 
             file_size = os.path.getsize(output_file)
             print(f"\n✅ [SUCCESS] Export berhasil!")
@@ -545,8 +726,145 @@ class OptimizedKeywordAnalyzer:
             print(f"❌ [ERROR] Gagal export: {e}")
             return None
 
+    def _iter_export_categories(self, include_sensitive):
+        """Hasilkan (kategori, jumlah, iterator entri) untuk setiap kategori yang berisi"""
+        # Baris yang cocok di beberapa kategori berbagi satu dict data;
+        # sel JSON-nya di-parse sekali dan disimpan hanya sampai match
+        # terakhir baris itu selesai diexport
+        remaining = Counter(id(match["data"]) for match in self.iter_matches())
+        parsed_rows = {}
+
+        def entries(matches):
+            for i, match in enumerate(matches):
+                # Progress untuk kategori besar
+                if i % 1000 == 0 and i > 0:
+                    print(f"      📊 Progress: {i:,}/{len(matches):,}")
+                yield self._export_entry(match, include_sensitive, remaining, parsed_rows)
+
+        for category, matches in self.results["keywords"].items():
+            if matches:
+                print(f"   📁 Exporting {category}: {len(matches):,} items...")
+                yield category, len(matches), entries(matches)
+
+    def _write_json_export(self, f, export_data, include_sensitive):
+        """Tulis export sebagai JSON ringkas, satu entri per baris"""
+        f.write(b"{\n")
+        for key, value in export_data.items():
+            f.write(b"  " + _dumps(key) + b": " + _dumps(value) + b",\n")
+        f.write(b'  "detailed_results": {')
+
+        separator = b"\n"
+        for category, _, entries in self._iter_export_categories(include_sensitive):
+            f.write(separator + b"    " + _dumps(category) + b": [\n")
+            for i, entry in enumerate(entries):
+                if i:
+                    f.write(b",\n")
+                f.write(b"      " + _dumps(entry))
+            f.write(b"\n    ]")
+            separator = b",\n"
+
+        f.write(b"\n  }\n}\n")
+
+    def _write_msgpack_export(self, f, export_data, include_sensitive):
+        """Tulis export sebagai msgpack dengan struktur yang sama seperti JSON"""
+        packer = msgpack.Packer(default=str)
+        categories = [
+            category for category, matches in self.results["keywords"].items() if matches
+        ]
+
+        f.write(packer.pack_map_header(len(export_data) + 1))
+        for key, value in export_data.items():
+            f.write(packer.pack(key))
+            f.write(packer.pack(value))
+
+        f.write(packer.pack("detailed_results"))
+        f.write(packer.pack_map_header(len(categories)))
+        for category, count, entries in self._iter_export_categories(include_sensitive):
+            f.write(packer.pack(category))
+            f.write(packer.pack_array_header(count))
+            for entry in entries:
+                f.write(packer.pack(entry))
+
+    def _export_entry(self, match, include_sensitive, remaining, parsed_rows):
+        """Bentuk satu entri export dari sebuah match"""
+        data = match["data"]
+        key = id(data)
+        remaining[key] -= 1
+
+        # Filter data sensitif jika diperlukan
+        if not include_sensitive and match.get("sensitivity") == "high":
+            if not remaining[key]:
+                parsed_rows.pop(key, None)
+            return {
+                "table": match["table"],
+                "category": match["category"],
+                "matched_keywords": match["matched_keywords"],
+                "sensitivity": match["sensitivity"],
+                "data_summary": f"[FILTERED - {len(data)} sensitive fields]",
+            }
+
+        parsed = parsed_rows.get(key)
+        if parsed is None:
+            parsed = self._parse_json_cells(data)
+        if remaining[key]:
+            parsed_rows[key] = parsed
+        else:
+            parsed_rows.pop(key, None)
+
+        return {
+            "table": match["table"],
+            "category": match["category"],
+            "matched_keywords": match["matched_keywords"],
+            "sensitivity": match["sensitivity"],
+            "data": parsed,
+        }
+
+    @staticmethod
+    def _parse_json_cells(data):
+        """Salin data baris dengan sel berbentuk JSON sudah di-parse"""
+        parsed = {}
+        for col, value in data.items():
+            if isinstance(value, str) and value.strip().startswith(("{", "[")):
+                try:
+                    value = _json_loads(value)
+                except (ValueError, RecursionError):
+                    pass
+            parsed[col] = value
+        return parsed
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(
+        description="Analisis kata kunci state.vscdb dengan performa tinggi"
+    )
+    parser.add_argument(
+        "db_path", nargs="?", help="Path ke state.vscdb (default: cari di direktori script)"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=500, help="Jumlah baris per batch (default: 500)"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=8, help="Jumlah thread pemindai tabel (default: 8)"
+    )
+    parser.add_argument(
+        "--export",
+        choices=("none", "safe", "full"),
+        help="Export tanpa prompt: none, safe (data sensitif disensor), full (SEMUA data)",
+    )
+    parser.add_argument("--output", help="Nama file export (default: dengan timestamp)")
+    parser.add_argument(
+        "--export-format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="Format file export (default: json)",
+    )
+    return parser.parse_args(argv)
+
 
 def main():
+    args = parse_args()
+    interactive = sys.stdin.isatty()
+
     print("🚀 [OPTIMIZED KEYWORD ANALYZER] Analisis Maksimal dengan Performa Tinggi")
     print("=" * 80)
     print("🎯 Target: SEMUA data token, kredensial, subscription, AI features, dll")
@@ -560,19 +878,13 @@ def main():
         os.path.join(script_dir, "state(2).vscdb"),
     ]
 
-    db_path = None
-    batch_size = 500
+    db_path = args.db_path
+    batch_size = args.batch_size
+    export_format = args.export_format
 
-    # Parse arguments
-    if len(sys.argv) > 1:
-        for arg in sys.argv[1:]:
-            if arg.startswith("--batch-size="):
-                batch_size = int(arg.split("=")[1])
-            elif os.path.exists(arg):
-                db_path = arg
-            elif not db_path:
-                print(f"❌ [ERROR] File tidak ditemukan: {arg}")
-                return
+    if db_path and not os.path.exists(db_path):
+        print(f"❌ [ERROR] File tidak ditemukan: {db_path}")
+        return
 
     if not db_path:
         for path in local_paths:
@@ -584,16 +896,16 @@ def main():
         print("❌ [ERROR] File state.vscdb tidak ditemukan!")
         print("💡 [SOLUTION] Copy file state.vscdb ke direktori script ini")
         print(
-            "📍 [USAGE] python keyword_analyzer_optimized.py [path] [--batch-size=500]"
+            "📍 [USAGE] python keyword_analyzer_optimized.py [path] [--batch-size=500] [--jobs=8] [--export=none|safe|full] [--output=FILE] [--export-format=json|msgpack]"
         )
         return
 
     print(f"🗃️  [DATABASE] File: {db_path}")
     print(f"⚙️  [CONFIG] Batch size: {batch_size}")
 
-    # Konfirmasi untuk file besar
+    # Konfirmasi untuk file besar (hanya jika dijalankan interaktif)
     file_size = os.path.getsize(db_path)
-    if file_size > 100 * 1024 * 1024:  # > 100MB
+    if interactive and file_size > 100 * 1024 * 1024:  # > 100MB
         print(f"\n⚠️  [WARNING] File berukuran besar ({file_size / 1024 / 1024:.1f} MB)")
         confirm = input("Lanjutkan analisis lengkap? (y/n): ").lower()
         if confirm not in ["y", "yes"]:
@@ -601,7 +913,7 @@ def main():
             return
 
     # Inisialisasi analyzer
-    analyzer = OptimizedKeywordAnalyzer(db_path, batch_size=batch_size)
+    analyzer = OptimizedKeywordAnalyzer(db_path, batch_size=batch_size, jobs=args.jobs)
 
     try:
         start_time = time.time()
@@ -615,7 +927,7 @@ def main():
         # 1. Pencarian kata kunci optimized
         analyzer.search_keywords_optimized()
 
-        if len(analyzer.results["raw_data"]) == 0:
+        if analyzer.count_matches() == 0:
             print("\n❌ [RESULT] Tidak ada kata kunci ditemukan")
             return
 
@@ -625,36 +937,39 @@ def main():
         # 3. Generate laporan komprehensif
         analyzer.generate_comprehensive_report()
 
-        # 4. Export
-        print("\n💾 [EXPORT OPTIONS]")
-        print("1. Export lengkap tanpa sensor (SEMUA data)")
-        print("2. Export dengan sensor data sensitif")
-        print("3. Tidak export")
-
-        choice = input("Pilih opsi (1/2/3): ").strip()
-
-        if choice == "1":
-            confirm = input(
-                "⚠️  Export SEMUA data termasuk sensitif? (yes/no): "
-            ).lower()
-            if confirm in ["yes", "y"]:
-                export_file = analyzer.export_comprehensive_results(
-                    include_sensitive=True
-                )
-            else:
-                export_file = analyzer.export_comprehensive_results(
-                    include_sensitive=False
-                )
-        elif choice == "2":
-            export_file = analyzer.export_comprehensive_results(include_sensitive=False)
+        # 4. Export: dari --export, atau tanya pengguna jika interaktif
+        export_mode = args.export
+        if export_mode is None and interactive:
+            print("\n💾 [EXPORT OPTIONS]")
+            print("1. Export lengkap tanpa sensor (SEMUA data)")
+            print("2. Export dengan sensor data sensitif")
+            print("3. Tidak export")
+
+            choice = input("Pilih opsi (1/2/3): ").strip()
+
+            if choice == "1":
+                confirm = input(
+                    "⚠️  Export SEMUA data termasuk sensitif? (yes/no): "
+                ).lower()
+                export_mode = "full" if confirm in ["yes", "y"] else "safe"
+            elif choice == "2":
+                export_mode = "safe"
+
+        export_file = None
+        if export_mode in ("safe", "full"):
+            export_file = analyzer.export_comprehensive_results(
+                output_file=args.output,
+                include_sensitive=export_mode == "full",
+                export_format=export_format,
+            )
 
         total_time = time.time() - start_time
 
         print(f"\n🎉 [COMPLETED] Analisis lengkap selesai!")
         print(f"⏱️  Total waktu: {total_time:.1f} detik")
-        print(f"📊 Total diproses: {len(analyzer.results['raw_data']):,} items")
+        print(f"📊 Total diproses: {analyzer.count_matches():,} items")
 
-        if "export_file" in locals() and export_file:
+        if export_file:
             print(f"📄 Export file: {export_file}")
 
     except Exception as e:
@@ -5,33 +5,163 @@ Output berupa folder dengan nama file database (tanpa ekstensi), berisi banyak f
 Author: AI Assistant
 """
 
+import argparse
+import gc
 import sqlite3
 import json
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from datetime import datetime
+from io import StringIO
+from itertools import repeat
 from pathlib import Path
-import base64
+from binascii import b2a_base64
+from math import isfinite
+
+# orjson opsional: parsing dan serialisasi JSON jauh lebih cepat untuk database besar
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# msgpack / cbor2 opsional: format data biner tanpa overhead teks JSON dan base64
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import cbor2
+
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+
+# Format file *_data; nama format sekaligus ekstensi file
+ENCODINGS = ("json", "msgpack", "cbor")
+
+# Skema tabel ItemTable/cursorDiskKV di state.vscdb (key TEXT, value BLOB)
+KV_COLUMNS = ["key", "value"]
+
+# Jumlah baris yang diambil per fetchmany saat ekspor data tabel
+FETCH_BATCH_SIZE = 1000
+
+# Penanda nilai BLOB yang bukan UTF-8 valid dan ditulis sebagai base64
+_BINARY_PREFIX = "[BINARY DATA - BASE64]: "
+
+# Awal nilai yang layak dicoba sebagai JSON object/array (spasi sesuai spesifikasi JSON)
+_JSON_OPENERS = frozenset("{[")
+_JSON_SPACES = frozenset(" \t\n\r")
+_JSON_FIRST_CHARS = _JSON_OPENERS | _JSON_SPACES
+_JSON_OPENER_BYTES = frozenset((b"{", b"["))
+_JSON_SPACE_BYTES = frozenset((b" ", b"\t", b"\n", b"\r"))
+
+
+# orjson membaca integer >= 19 digit (di luar int64/uint64) sebagai float tanpa
+# error; nilai yang memuat deret digit sepanjang ini di-parse json standar.
+# translate() memetakan digit ke "0" dan byte lain ke spasi (lebih cepat dari regex)
+_DIGIT_MASK = bytes(48 if 48 <= i <= 57 else 32 for i in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
+
+
+class _NonFiniteFloat(float):
+    """NaN/Infinity: orjson menulisnya sebagai null, json standar sebagai NaN/Infinity"""
+
+    __slots__ = ()
+
+
+def _parse_float(text):
+    """parse_float json standar: float tak hingga (mis. 1e999) ditandai _NonFiniteFloat"""
+    value = float(text)
+    return value if isfinite(value) else _NonFiniteFloat(value)
+
+
+def _has_long_digit_run(text):
+    """Cek apakah teks/bytes JSON memuat deret >= 19 digit ASCII"""
+    if isinstance(text, str):
+        text = text.encode("utf-8", "surrogatepass")
+    return _LONG_DIGIT_RUN in text.translate(_DIGIT_MASK)
+
+
+def _json_loads(text):
+    """Parse JSON (orjson jika tersedia)"""
+    if ORJSON_AVAILABLE:
+        if not _has_long_digit_run(text):
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                # orjson menolak NaN/Infinity dan angka di luar jangkauan double
+                pass
+    if isinstance(text, bytes):
+        # json standar menebak UTF-16/32 dari bytes; nilai database selalu diperlakukan UTF-8
+        text = text.decode("utf-8")
+    return json.loads(text, parse_float=_parse_float, parse_constant=_NonFiniteFloat)
+
+
+def _orjson_default(obj):
+    """default orjson: NaN/Infinity dilempar balik agar _dumps memakai json standar"""
+    if isinstance(obj, _NonFiniteFloat):
+        raise TypeError("non-finite float")
+    return str(obj)
+
+
+def _dumps(obj):
+    """Serialisasi objek ke bytes JSON dengan indent 2 (orjson jika tersedia)"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=_orjson_default)
+        except orjson.JSONEncodeError:
+            # Integer > 64-bit atau NaN/Infinity; json standar menulisnya apa adanya
+            pass
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=str).encode("utf-8")
 
 
 class StateVscdbConverter:
-    def __init__(self, db_path):
+    def __init__(self, db_path, jobs=1, encoding="json", blob_threshold=None):
         self.db_path = db_path
+        db_file = Path(db_path)
+        self._db_name = db_file.name
+        self._db_stem = db_file.stem
+        # jobs > 1: tabel diekspor paralel, masing-masing dengan snapshot sendiri
+        self.jobs = max(1, jobs or 1)
+        self.encoding = encoding
+        # BLOB biner >= blob_threshold byte ditulis ke file .bin terpisah (None = base64)
+        self.blob_threshold = blob_threshold
+        self._blob_dir = None
+        self._blob_count = 0
         self.output_dir = None
         self.conn = None
-        self.stats = {"tables": 0, "total_rows": 0, "total_files": 0}
+        self._tables = None
+        self._table_info_cache = {}
+        self._paths = {}
+        self.stats = {
+            "tables": 0,
+            "total_rows": 0,
+            "total_files": 0,
+            "blob_files": 0,
+            "rows_per_table": {},
+        }
 
     def connect(self):
         """Koneksi ke database SQLite"""
         try:
-            if not os.path.exists(self.db_path):
+            # Satu stat() untuk cek keberadaan sekaligus ukuran file
+            try:
+                file_size = os.stat(self.db_path).st_size
+            except FileNotFoundError:
                 print(f"❌ [ERROR] File tidak ditemukan: {self.db_path}")
                 return False
 
-            self.conn = sqlite3.connect(self.db_path)
+            # Database hanya dibaca; file milik pengguna tidak pernah diubah
+            self.conn = self._open_readonly_connection()
             print(f"✅ [SUCCESS] Berhasil terhubung ke database: {self.db_path}")
 
-            file_size = os.path.getsize(self.db_path)
             print(
                 f"📊 [INFO] Ukuran file: {file_size:,} bytes ({file_size / 1024 / 1024:.2f} MB)"
             )
@@ -41,21 +171,49 @@ class StateVscdbConverter:
             print(f"❌ [ERROR] Gagal terhubung: {e}")
             return False
 
+    def _open_readonly_connection(self):
+        """Koneksi read-only dengan PRAGMA untuk pemindaian penuh"""
+        # Tanpa immutable=1: Cursor bisa sedang menulis ke file ini dan isi WAL-nya
+        # harus tetap terbaca
+        uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("PRAGMA temp_store = memory")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        conn.execute("PRAGMA query_only = 1")
+        return conn
+
     def close(self):
         """Tutup koneksi database"""
         if self.conn:
             self.conn.close()
 
     def get_tables(self):
-        """Dapatkan daftar semua tabel dalam database"""
-        cursor = self.conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-        tables = [table[0] for table in cursor.fetchall()]
-        return tables
+        """Dapatkan daftar semua tabel dalam database (di-cache setelah query pertama)"""
+        if self._tables is None:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+            self._tables = [table[0] for table in cursor.fetchall()]
+        return self._tables
+
+    def _table_info(self, table_name):
+        """Hasil PRAGMA table_info untuk tabel, di-cache per tabel"""
+        info = self._table_info_cache.get(table_name)
+        if info is None:
+            cursor = self.conn.execute(
+                f"PRAGMA table_info({self._quote_identifier(table_name)})"
+            )
+            info = self._table_info_cache[table_name] = cursor.fetchall()
+        return info
+
+    @staticmethod
+    def _quote_identifier(name):
+        """Kutip nama tabel/kolom SQLite dengan aman"""
+        return '"' + name.replace('"', '""') + '"'
 
     def create_output_structure(self):
         """Buat folder output dengan nama file database tanpa ekstensi"""
-        base_name = Path(self.db_path).stem
+        base_name = self._db_stem
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.output_dir = Path(f"{base_name}_converted_{timestamp}")
         self.output_dir.mkdir(exist_ok=True)
@@ -63,7 +221,7 @@ class StateVscdbConverter:
         # Buat folder untuk setiap tabel
         tables = self.get_tables()
         for table in tables:
-            (self.output_dir / table).mkdir(exist_ok=True)
+            self._table_paths(table)["dir"].mkdir(exist_ok=True)
 
         # Buat folder summary
         (self.output_dir / "summary").mkdir(exist_ok=True)
@@ -71,79 +229,196 @@ class StateVscdbConverter:
 
         print(f"📁 [OUTPUT] Folder output dibuat: {self.output_dir}")
 
+    def _table_paths(self, table_name):
+        """Path folder dan file output satu tabel, dihitung sekali per tabel"""
+        paths = self._paths.get(table_name)
+        if paths is None:
+            table_dir = self.output_dir / table_name
+            paths = self._paths[table_name] = {
+                "dir": table_dir,
+                "data": table_dir / f"{table_name}_data.{self.encoding}",
+                "schema": table_dir / f"{table_name}_schema.json",
+                "summary": table_dir / f"{table_name}_summary.txt",
+                "blobs": table_dir / "blobs",
+            }
+        return paths
+
     def process_value(self, value):
         """Proses nilai untuk membuatnya mudah dibaca"""
         if value is None:
             return None
         elif isinstance(value, bytes):
+            # Cek karakter pertama dulu; hanya kandidat JSON yang di-parse (langsung dari bytes)
+            first = value[:1]
+            if first in _JSON_OPENER_BYTES or (
+                first in _JSON_SPACE_BYTES and value.lstrip()[:1] in _JSON_OPENER_BYTES
+            ):
+                try:
+                    return _json_loads(value)
+                except Exception:
+                    pass
             # Coba decode sebagai UTF-8
             try:
-                decoded = value.decode("utf-8")
-                # Jika terlihat seperti JSON, parse it
-                if decoded.strip().startswith(("{", "[")):
-                    try:
-                        return json.loads(decoded)
-                    except:
-                        pass
-                return decoded
+                return value.decode("utf-8")
             except UnicodeDecodeError:
-                # Jika gagal decode, encode sebagai base64
-                return (
-                    f"[BINARY DATA - BASE64]: {base64.b64encode(value).decode('ascii')}"
-                )
+                # msgpack/CBOR punya tipe byte string sendiri; base64 hanya untuk JSON
+                if self.encoding != "json":
+                    return value
+                if self.blob_threshold is not None and len(value) >= self.blob_threshold:
+                    return self._write_blob(value)
+                # Jika gagal decode, encode sebagai base64 (binascii langsung, tanpa wrapper)
+                return _BINARY_PREFIX + b2a_base64(value, newline=False).decode("ascii")
         elif isinstance(value, str):
             # Coba parse sebagai JSON jika terlihat seperti JSON
-            if value.strip().startswith(("{", "[")):
+            first = value[:1]
+            if first in _JSON_OPENERS or (
+                first in _JSON_SPACES and value.lstrip()[:1] in _JSON_OPENERS
+            ):
                 try:
-                    return json.loads(value)
-                except:
+                    return _json_loads(value)
+                except Exception:
                     pass
             return value
+        elif value.__class__ is float and not isfinite(value):
+            # Kolom REAL berisi NaN/Infinity: tandai agar _dumps tidak menulis null
+            return _NonFiniteFloat(value)
         else:
             return value
 
+    def _write_blob(self, value):
+        """Simpan BLOB biner ke file sidecar dan kembalikan referensinya"""
+        if not self._blob_count:
+            self._blob_dir.mkdir(exist_ok=True)
+        self._blob_count += 1
+        name = f"blob_{self._blob_count:06d}.bin"
+        with open(self._blob_dir / name, "wb") as f:
+            f.write(value)
+        return {"__blob__": f"blobs/{name}", "size": len(value)}
+
     def export_table_data(self, table_name):
-        """Ekspor seluruh isi tabel ke file JSON"""
+        """Ekspor seluruh isi tabel ke file data (JSON/msgpack/CBOR) secara streaming per batch"""
         cursor = self.conn.cursor()
         try:
-            cursor.execute(f"SELECT * FROM {table_name}")
-            rows = cursor.fetchall()
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = [col[1] for col in cursor.fetchall()]
-
-            data_list = []
-            for row in rows:
-                row_dict = {}
-                for col, val in zip(columns, row):
-                    row_dict[col] = self.process_value(val)
-                data_list.append(row_dict)
-
-            # Simpan ke file JSON
-            table_dir = self.output_dir / table_name
-            output_file = table_dir / f"{table_name}_data.json"
-            with open(output_file, "w", encoding="utf-8") as f:
-                json.dump(data_list, f, indent=2, ensure_ascii=False, default=str)
+            columns = [col[1] for col in self._table_info(table_name)]
+            cursor.arraysize = FETCH_BATCH_SIZE
+            cursor.execute(f"SELECT * FROM {self._quote_identifier(table_name)}")
+
+            # Tulis per batch agar memori tidak bergantung ukuran tabel
+            paths = self._table_paths(table_name)
+            output_file = paths["data"]
+            self._blob_dir = paths["blobs"]
+            self._blob_count = 0
+            if columns == KV_COLUMNS:
+                batches = self._iter_kv_batches(cursor)
+            else:
+                batches = self._iter_row_batches(cursor, columns)
+            # Dict/list hasil baris tidak membentuk siklus dan dibebaskan lewat
+            # reference counting; GC siklik hanya menambah pemindaian per alokasi
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                # Buffer 1 MiB: banyak batch kecil digabung jadi sedikit syscall write
+                with open(output_file, "wb", buffering=1 << 20) as f:
+                    if self.encoding == "msgpack":
+                        row_count = self._write_msgpack_rows(f, batches)
+                    elif self.encoding == "cbor":
+                        row_count = self._write_cbor_rows(f, batches)
+                    else:
+                        row_count = self._write_json_rows(f, batches)
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
 
             print(
-                f"   📄 Tabel '{table_name}' diekspor ke {output_file} ({len(data_list)} baris)"
+                f"   📄 Tabel '{table_name}' diekspor ke {output_file} ({row_count} baris)"
             )
+            if self._blob_count:
+                print(f"   📦 {self._blob_count} BLOB biner disimpan di {self._blob_dir}")
 
             # Update statistik
-            self.stats["total_rows"] += len(data_list)
+            self.stats["total_rows"] += row_count
             self.stats["total_files"] += 1
+            self.stats["blob_files"] += self._blob_count
+            self.stats["rows_per_table"][table_name] = row_count
 
-            return len(data_list)
+            return row_count
 
         except Exception as e:
             print(f"❌ [ERROR] Gagal ekspor tabel {table_name}: {e}")
             return 0
 
+    def _iter_row_batches(self, cursor, columns):
+        """Hasilkan baris hasil query per batch fetchmany sebagai list dict"""
+        process_value = self.process_value
+        rows = cursor.fetchmany()
+        while rows:
+            # dict(zip(...)) membangun baris di C, tanpa __setitem__ per sel
+            yield [dict(zip(columns, map(process_value, row))) for row in rows]
+            rows = cursor.fetchmany()
+
+    def _iter_kv_batches(self, cursor):
+        """Fast path untuk tabel key/value state.vscdb (ItemTable, cursorDiskKV)"""
+        process_value = self.process_value
+        rows = cursor.fetchmany()
+        while rows:
+            # Key hampir selalu string biasa: process_value hanya jika bisa jadi JSON
+            yield [
+                {
+                    "key": (
+                        key
+                        if key.__class__ is str and key[:1] not in _JSON_FIRST_CHARS
+                        else process_value(key)
+                    ),
+                    "value": process_value(value),
+                }
+                for key, value in rows
+            ]
+            rows = cursor.fetchmany()
+
+    @staticmethod
+    def _write_json_rows(f, batches):
+        """Tulis batch sebagai satu array JSON (indent 2), kembalikan jumlah baris"""
+        row_count = 0
+        f.write(b"[")
+        for batch in batches:
+            # Buang "[" dan "\n]" agar batch menyambung dalam satu array; memoryview
+            # menghindari salinan kedua dari hasil encode satu batch
+            if row_count:
+                f.write(b",")
+            f.write(memoryview(_dumps(batch))[1:-2])
+            row_count += len(batch)
+        f.write(b"\n]" if row_count else b"]")
+        return row_count
+
+    @staticmethod
+    def _write_msgpack_rows(f, batches):
+        """Tulis batch sebagai satu array msgpack, kembalikan jumlah baris"""
+        packer = msgpack.Packer(default=str)
+        # Header array32 dengan panjang sementara; diisi setelah jumlah baris diketahui
+        f.write(b"\xdd\x00\x00\x00\x00")
+        row_count = 0
+        for batch in batches:
+            f.write(b"".join(map(packer.pack, batch)))
+            row_count += len(batch)
+        f.seek(0)
+        f.write(b"\xdd" + row_count.to_bytes(4, "big"))
+        return row_count
+
+    @staticmethod
+    def _write_cbor_rows(f, batches):
+        """Tulis batch sebagai satu array CBOR (panjang tak tentu), kembalikan jumlah baris"""
+        row_count = 0
+        f.write(b"\x9f")
+        for batch in batches:
+            f.write(b"".join(map(cbor2.dumps, batch)))
+            row_count += len(batch)
+        f.write(b"\xff")
+        return row_count
+
     def export_table_schema(self, table_name):
         """Ekspor schema tabel"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            schema = cursor.fetchall()
+            schema = self._table_info(table_name)
 
             schema_data = []
             for col in schema:
@@ -158,10 +433,9 @@ class StateVscdbConverter:
                     }
                 )
 
-            table_dir = self.output_dir / table_name
-            schema_file = table_dir / f"{table_name}_schema.json"
-            with open(schema_file, "w", encoding="utf-8") as f:
-                json.dump(schema_data, f, indent=2, ensure_ascii=False)
+            schema_file = self._table_paths(table_name)["schema"]
+            with open(schema_file, "wb") as f:
+                f.write(_dumps(schema_data))
 
             print(f"   📋 Schema tabel '{table_name}' diekspor ke {schema_file}")
 
@@ -170,10 +444,8 @@ class StateVscdbConverter:
 
     def export_table_summary(self, table_name, row_count):
         """Buat file summary untuk tabel"""
-        cursor = self.conn.cursor()
         try:
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
+            columns = self._table_info(table_name)
 
             summary_data = {
                 "table_name": table_name,
@@ -183,8 +455,7 @@ class StateVscdbConverter:
                 "exported_at": datetime.now().isoformat(),
             }
 
-            table_dir = self.output_dir / table_name
-            summary_file = table_dir / f"{table_name}_summary.txt"
+            summary_file = self._table_paths(table_name)["summary"]
             with open(summary_file, "w", encoding="utf-8") as f:
                 f.write(f"SUMMARY: {table_name.upper()}\n")
                 f.write("=" * 50 + "\n\n")
@@ -203,6 +474,38 @@ class StateVscdbConverter:
         except Exception as e:
             print(f"❌ [ERROR] Gagal buat summary {table_name}: {e}")
 
+    def export_table(self, table_name):
+        """Ekspor data, schema, dan summary satu tabel"""
+        print(f"\n🔄 [TABLE] Memproses tabel: {table_name}")
+        row_count = self.export_table_data(table_name)
+        self.export_table_schema(table_name)
+        self.export_table_summary(table_name, row_count)
+
+    def export_tables(self, tables):
+        """Ekspor semua tabel; paralel per tabel dengan proses worker jika jobs > 1"""
+        workers = min(self.jobs, len(tables))
+        if workers <= 1:
+            for table in tables:
+                self.export_table(table)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(
+                _export_one_table,
+                repeat(self.db_path),
+                tables,
+                repeat(self.output_dir),
+                repeat(self.encoding),
+                repeat(self.blob_threshold),
+            )
+            # Log dan statistik digabung sesuai urutan tabel
+            for log, stats in results:
+                sys.stdout.write(log)
+                self.stats["total_rows"] += stats["total_rows"]
+                self.stats["total_files"] += stats["total_files"]
+                self.stats["blob_files"] += stats["blob_files"]
+                self.stats["rows_per_table"].update(stats["rows_per_table"])
+
     def create_database_summary(self):
         """Buat summary keseluruhan database"""
         tables = self.get_tables()
@@ -216,44 +519,37 @@ class StateVscdbConverter:
         }
 
         for table in tables:
-            table_dir = self.output_dir / table
-            data_file = table_dir / f"{table}_data.json"
-            if data_file.exists():
-                with open(data_file, "r", encoding="utf-8") as f:
-                    try:
-                        data = json.load(f)
-                        row_count = len(data)
-                    except:
-                        row_count = 0
-            else:
-                row_count = 0
+            paths = self._table_paths(table)
+            row_count = self.stats["rows_per_table"].get(table, 0)
 
             summary_data["tables"].append(
                 {
                     "name": table,
                     "rows": row_count,
-                    "data_file": str(data_file),
-                    "schema_file": str(table_dir / f"{table}_schema.json"),
-                    "summary_file": str(table_dir / f"{table}_summary.txt"),
+                    "data_file": str(paths["data"]),
+                    "schema_file": str(paths["schema"]),
+                    "summary_file": str(paths["summary"]),
                 }
             )
 
         summary_file = self.output_dir / "summary" / "database_summary.json"
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        with open(summary_file, "wb") as f:
+            f.write(_dumps(summary_data))
 
         print(f"📊 [SUMMARY] Database summary dibuat: {summary_file}")
 
     def create_html_report(self):
         """Buat laporan HTML untuk navigasi"""
         tables = self.get_tables()
-        html_content = f"""
+        # Potongan HTML dikumpulkan dalam list lalu digabung sekali di akhir
+        parts = [
+            f"""
 <!DOCTYPE html>
 <html lang="id">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Database Export Report - {Path(self.db_path).name}</title>
+    <title>Database Export Report - {self._db_name}</title>
     <style>
         body {{ font-family: Arial, sans-serif; margin: 20px; background-color: #f5f5f5; }}
         .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
@@ -273,7 +569,7 @@ class StateVscdbConverter:
 <body>
     <div class="container">
         <h1>🗃️ Database Export Report</h1>
-        <p><strong>File:</strong> {Path(self.db_path).name}</p>
+        <p><strong>File:</strong> {self._db_name}</p>
         <p><strong>Exported:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
 
         <div class="summary">
@@ -303,63 +599,68 @@ class StateVscdbConverter:
                 <th>Schema File</th>
                 <th>Summary File</th>
             </tr>"""
+        ]
 
         for table in tables:
-            table_dir = self.output_dir / table
-            data_file = table_dir / f"{table}_data.json"
-            schema_file = table_dir / f"{table}_schema.json"
-            summary_file = table_dir / f"{table}_summary.txt"
-
-            # Hitung jumlah baris
-            row_count = 0
-            if data_file.exists():
-                try:
-                    with open(data_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        row_count = len(data)
-                except:
-                    row_count = 0
+            paths = self._table_paths(table)
+            data_file = paths["data"]
+            schema_file = paths["schema"]
+            summary_file = paths["summary"]
+
+            # Jumlah baris dicatat saat ekspor, tanpa membaca ulang file JSON
+            row_count = self.stats["rows_per_table"].get(table, 0)
 
-            html_content += f"""
+            parts.append(
+                f"""
             <tr>
                 <td><strong>{table}</strong></td>
                 <td>{row_count:,}</td>
-                <td><a href="{data_file.name}" class="file-link">📄 {table}_data.json</a></td>
+                <td><a href="{data_file.name}" class="file-link">📄 {data_file.name}</a></td>
                 <td><a href="{schema_file.name}" class="file-link">📋 {table}_schema.json</a></td>
                 <td><a href="{summary_file.name}" class="file-link">📋 {table}_summary.txt</a></td>
             </tr>"""
+            )
 
-        html_content += """
+        parts.append(
+            """
         </table>
 
         <h2>📁 File Structure</h2>
         <div style="font-family: monospace; background: #f8f9fa; padding: 15px; border-radius: 5px;">
 """
+        )
 
         # Buat struktur tree
-        tree_content = f"""📁 {self.output_dir.name}/
+        tree_parts = [
+            f"""📁 {self.output_dir.name}/
 ├── 📁 summary/
 │   └── 📄 database_summary.json
 ├── 📁 reports/
 │   └── 📄 export_report.html"""
+        ]
 
         for table in tables:
-            tree_content += f"""
+            tree_parts.append(
+                f"""
 ├── 📁 {table}/
-│   ├── 📄 {table}_data.json
+│   ├── 📄 {table}_data.{self.encoding}
 │   ├── 📄 {table}_schema.json
 │   └── 📄 {table}_summary.txt"""
+            )
 
-        html_content += f"<pre>{tree_content}</pre>"
-        html_content += """
+        tree_content = "".join(tree_parts)
+        parts.append(f"<pre>{tree_content}</pre>")
+        parts.append(
+            """
         </div>
     </div>
 </body>
 </html>"""
+        )
 
         html_file = self.output_dir / "reports" / "export_report.html"
         with open(html_file, "w", encoding="utf-8") as f:
-            f.write(html_content)
+            f.write("".join(parts))
 
         print(f"🌐 [HTML] Laporan HTML dibuat: {html_file}")
 
@@ -367,40 +668,104 @@ class StateVscdbConverter:
         """Jalankan proses konversi seluruh isi database"""
         print("🔄 [CONVERTER] Script Konversi Database Lengkap")
         print("=" * 50)
-        print(f"📁 Target: {Path(self.db_path).name}")
+        print(f"📁 Target: {self._db_name}")
         print("=" * 50)
 
+        if self.encoding == "msgpack" and not MSGPACK_AVAILABLE:
+            print("⚠️  [WARNING] msgpack tidak terpasang - data diekspor sebagai JSON")
+            self.encoding = "json"
+        elif self.encoding == "cbor" and not CBOR_AVAILABLE:
+            print("⚠️  [WARNING] cbor2 tidak terpasang - data diekspor sebagai JSON")
+            self.encoding = "json"
+
         if not self.connect():
             return False
 
-        self.create_output_structure()
+        try:
+            # Satu transaksi baca untuk seluruh ekspor: dengan jobs=1 semua tabel
+            # berasal dari snapshot yang sama walau database sedang ditulis, dan
+            # lock tidak diambil ulang per statement. Dengan jobs > 1 setiap worker
+            # membaca lewat koneksinya sendiri, jadi konsistensi hanya per tabel
+            self.conn.execute("BEGIN")
 
-        tables = self.get_tables()
-        self.stats["tables"] = len(tables)
-        print(f"📋 [INFO] Menemukan {len(tables)} tabel: {', '.join(tables)}")
+            self.create_output_structure()
 
-        for table in tables:
-            print(f"\n🔄 [TABLE] Memproses tabel: {table}")
-            row_count = self.export_table_data(table)
-            self.export_table_schema(table)
-            self.export_table_summary(table, row_count)
+            tables = self.get_tables()
+            self.stats["tables"] = len(tables)
+            print(f"📋 [INFO] Menemukan {len(tables)} tabel: {', '.join(tables)}")
 
-        # Buat file summary dan laporan
-        self.create_database_summary()
-        self.create_html_report()
+            self.export_tables(tables)
 
-        self.close()
+            # Buat file summary dan laporan
+            self.create_database_summary()
+            self.create_html_report()
+
+            self.conn.execute("COMMIT")
+        finally:
+            # Transaksi baca yang belum selesai ikut dibatalkan saat koneksi ditutup
+            self.close()
 
         print("\n🎉 [COMPLETED] Konversi selesai!")
         print(f"📁 Output tersimpan di: {self.output_dir}")
         print(f"📊 Total tabel: {self.stats['tables']}")
         print(f"📊 Total baris: {self.stats['total_rows']:,}")
         print(f"📊 Total file: {self.stats['total_files']}")
+        if self.stats["blob_files"]:
+            print(f"📦 Total BLOB sidecar: {self.stats['blob_files']}")
         print(f"🌐 Buka laporan: {self.output_dir}/reports/export_report.html")
 
         return True
 
 
+def _export_one_table(
+    db_path, table_name, output_dir, encoding="json", blob_threshold=None
+):
+    """Worker proses: ekspor satu tabel dengan koneksi read-only sendiri"""
+    # Koneksi sqlite3 tidak bisa dibagi antar proses, jadi tiap worker membuka sendiri
+    converter = StateVscdbConverter(
+        db_path, jobs=1, encoding=encoding, blob_threshold=blob_threshold
+    )
+    converter.output_dir = output_dir
+    log = StringIO()
+    with redirect_stdout(log):
+        converter.conn = converter._open_readonly_connection()
+        try:
+            converter.export_table(table_name)
+        finally:
+            converter.close()
+    return log.getvalue(), converter.stats
+
+
+def parse_args(argv=None):
+    """Parse argumen command line"""
+    parser = argparse.ArgumentParser(
+        description="Konversi seluruh isi state.vscdb ke format yang mudah dibaca"
+    )
+    parser.add_argument(
+        "db_path", nargs="?", help="Path ke state.vscdb (default: cari di direktori script)"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Jumlah proses worker ekspor tabel; > 1 melepas snapshot tunggal (default: 1)",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=ENCODINGS,
+        default="json",
+        help="Format file *_data; msgpack/cbor menyimpan BLOB sebagai bytes asli (default: json)",
+    )
+    parser.add_argument(
+        "--blob-threshold",
+        type=int,
+        default=None,
+        metavar="BYTES",
+        help="Untuk JSON: BLOB biner >= BYTES ditulis ke <tabel>/blobs/*.bin, bukan base64",
+    )
+    return parser.parse_args(argv)
+
+
 def main():
     # Tentukan file database
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -409,9 +774,10 @@ def main():
         os.path.join(script_dir, "state(2).vscdb"),
     ]
 
+    args = parse_args()
     db_path = None
-    if len(sys.argv) > 1:
-        provided_path = sys.argv[1]
+    if args.db_path:
+        provided_path = args.db_path
         if os.path.exists(provided_path):
             db_path = provided_path
         else:
@@ -426,12 +792,19 @@ def main():
     if not db_path:
         print("❌ [ERROR] File state.vscdb tidak ditemukan!")
         print("💡 [SOLUTION] Copy file state.vscdb ke direktori script ini")
-        print("📍 [USAGE] python state_vscdb_converter.py [path_to_state.vscdb]")
+        print(
+            "📍 [USAGE] python state_vscdb_converter.py [path_to_state.vscdb] [--jobs=N] [--encoding=json|msgpack|cbor] [--blob-threshold=BYTES]"
+        )
         return
 
     print(f"🗃️  [DATABASE] Menggunakan file: {db_path}")
 
-    converter = StateVscdbConverter(db_path)
+    converter = StateVscdbConverter(
+        db_path,
+        jobs=args.jobs,
+        encoding=args.encoding,
+        blob_threshold=args.blob_threshold,
+    )
     converter.run_conversion()
 
 
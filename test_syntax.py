@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 """
 Simple test script to check syntax of advanced_analyzer.py
+and the --regex search of flexible_keyword_analyzer.py on binary BLOBs
 """
 
 import sys
 import os
+import py_compile
+import sqlite3
+import tempfile
 
 
 def test_syntax():
@@ -17,29 +21,65 @@ def test_syntax():
             print("❌ [ERROR] File advanced_analyzer.py not found")
             return False
 
-        with open(script_path, "r", encoding="utf-8") as f:
-            code = f.read()
-
-        # Try to compile the code
-        compile(code, script_path, "exec")
+        # Compile via py_compile; the resulting .pyc is reused by the next import
+        py_compile.compile(script_path, doraise=True)
         print("✅ [SUCCESS] Syntax check passed!")
         return True
 
-    except SyntaxError as e:
-        print(f"❌ [SYNTAX ERROR] Line {e.lineno}: {e.msg}")
-        print(f"   {e.text}")
+    except py_compile.PyCompileError as e:
+        error = e.exc_value
+        if isinstance(error, SyntaxError):
+            print(f"❌ [SYNTAX ERROR] Line {error.lineno}: {error.msg}")
+            print(f"   {error.text}")
+        else:
+            print(f"❌ [ERROR] {e.msg}")
         return False
     except Exception as e:
         print(f"❌ [ERROR] {e}")
         return False
 
 
+def test_regex_binary_blob():
+    """--regex must match BLOB cells (invalid UTF-8), with and without .kwcache"""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    from flexible_keyword_analyzer import FlexibleKeywordAnalyzer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "state.vscdb")
+        conn = sqlite3.connect(db_path)
+        conn.execute("CREATE TABLE cursorDiskKV (key TEXT, value BLOB)")
+        conn.execute(
+            "INSERT INTO cursorDiskKV VALUES (?, ?)",
+            ("bin", b"\xff\xfe\x00 secret_token \xc3\xa9t\xc3\xa9"),
+        )
+        conn.commit()
+        conn.close()
+
+        for build_cache in (True, False):
+            for pattern in ("secret_t.ken", "été"):
+                analyzer = FlexibleKeywordAnalyzer(
+                    db_path, [pattern], build_cache=build_cache, regex=True
+                )
+                if not analyzer.connect():
+                    return False
+                try:
+                    analyzer.search_keywords()
+                finally:
+                    analyzer.close()
+                if analyzer.results["total_matches"] != 1:
+                    print(f"❌ [ERROR] --regex {pattern!r} tidak menemukan BLOB")
+                    return False
+    print("✅ [SUCCESS] Regex BLOB check passed!")
+    return True
+
+
 if __name__ == "__main__":
     print("🔍 [TEST] Checking syntax of advanced_analyzer.py...")
     success = test_syntax()
+    success = test_regex_binary_blob() and success
 
     if success:
         print("\n🎉 Script is ready to run!")
         print("💡 Usage: python advanced_analyzer.py [--quick]")
     else:
-        print("\n⚠️  Please fix syntax errors before running")
+        print("\n⚠️  Please fix the errors above before running")